@@ -0,0 +1,201 @@
+"""Headless batch evaluation of MPRO400 exports.
+
+Usage::
+
+    python -m app.batch <directory> [--reference 1.5] [--torque-min 0.5] ...
+
+Only the ``data`` package is used, so this entry point never imports Qt and
+runs on servers without a display.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+if __package__ is None or __package__ == "":
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.config import CACHE_DIR
+from data.csv_loader import CsvFormatError, load_csv
+from data.curve_cache import CurveCache
+from data.data_manager import DataManager
+from data.spec import RULE_KINDS, SpecRule
+
+SUMMARY_COLUMNS = (
+    "file",
+    "reference_hit",
+    "peak_torque",
+    "final_angle",
+    "points",
+    "spec",
+    "spec_failures",
+    "error",
+)
+
+logger = logging.getLogger(__name__)
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+@dataclass
+class BatchSettings:
+    reference_torque: float = 0.0
+    torque_range: Range = (None, None)
+    angle_range: Range = (None, None)
+    cache_dir: Optional[Path] = None
+    spec_rules: Tuple[SpecRule, ...] = ()
+
+
+def summarize_file(path: Path, settings: BatchSettings) -> Dict[str, object]:
+    """Evaluate one export the same way the viewer does and summarise it."""
+
+    row: Dict[str, object] = {column: "" for column in SUMMARY_COLUMNS}
+    row["file"] = str(path)
+
+    cache = CurveCache(settings.cache_dir) if settings.cache_dir is not None else None
+    try:
+        csv_data = load_csv(path, cache=cache)
+    except (OSError, CsvFormatError, UnicodeDecodeError, ValueError) as exc:
+        row["error"] = str(exc) or type(exc).__name__
+        return row
+
+    manager = DataManager()
+    manager.update_reference(settings.reference_torque)
+    manager.update_ranges(settings.torque_range, settings.angle_range)
+    manager.set_spec_rules(settings.spec_rules)
+    dataset = manager.add_csv(csv_data)
+    payloads = manager.plot_payloads()
+
+    row["reference_hit"] = dataset.reference_hit if dataset is not None else False
+    verdict = manager.evaluate_specs().get(dataset.identifier) if dataset is not None else None
+    if verdict is not None:
+        row["spec"] = "OK" if verdict.passed else "NG"
+        row["spec_failures"] = ";".join(verdict.failures)
+    if dataset is not None and dataset.error:
+        row["error"] = dataset.error
+    if not payloads or payloads[0].x.size == 0:
+        row["points"] = 0
+        return row
+
+    payload = payloads[0]
+    row["peak_torque"] = float(payload.y.max())
+    row["final_angle"] = float(payload.x[-1])
+    row["points"] = int(payload.x.size)
+    return row
+
+
+def collect_paths(targets: Iterable[Path], pattern: str, recursive: bool) -> List[Path]:
+    paths: List[Path] = []
+    for target in targets:
+        if target.is_dir():
+            matches = target.rglob(pattern) if recursive else target.glob(pattern)
+            paths.extend(sorted(p for p in matches if p.is_file()))
+        else:
+            paths.append(target)
+    return paths
+
+
+def run_batch(
+    paths: Sequence[Path],
+    settings: BatchSettings,
+    workers: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """Summarise ``paths`` on a process pool, keeping the input order."""
+
+    worker = partial(summarize_file, settings=settings)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = max(1, min(workers, len(paths)))
+    if workers == 1:
+        return [worker(path) for path in paths]
+
+    chunksize = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(worker, paths, chunksize=chunksize))
+
+
+def write_summary(rows: Sequence[Dict[str, object]], stream) -> None:
+    writer = csv.DictWriter(stream, fieldnames=list(SUMMARY_COLUMNS), extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.batch",
+        description="MPRO400 CSV 일괄 분석 (GUI 없이 요약 표 작성)",
+    )
+    parser.add_argument("targets", nargs="+", type=Path, help="CSV 파일 또는 폴더")
+    parser.add_argument("--pattern", default="*.csv", help="폴더에서 찾을 파일 패턴 (기본: *.csv)")
+    parser.add_argument("--recursive", action="store_true", help="하위 폴더까지 검색")
+    parser.add_argument("--reference", type=float, default=0.0, help="기준 토크 (N-m), 0이면 비활성")
+    parser.add_argument("--torque-min", type=float)
+    parser.add_argument("--torque-max", type=float)
+    parser.add_argument("--angle-min", type=float)
+    parser.add_argument("--angle-max", type=float)
+    parser.add_argument(
+        "--spec",
+        action="append",
+        default=[],
+        metavar="항목:하한:상한",
+        help=f"합격 기준 (반복 가능, 빈 값은 제한 없음). 항목: {', '.join(RULE_KINDS)}",
+    )
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--cache", action="store_true", help="~/.mpro400_analyzer/cache 파싱 캐시 사용")
+    parser.add_argument("-o", "--output", type=Path, help="요약 CSV 경로 (기본: 표준 출력)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", stream=sys.stderr)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        spec_rules = tuple(SpecRule.parse(text) for text in args.spec)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.reference <= 0 and any(rule.kind == "angle_after_reference" for rule in spec_rules):
+        parser.error("--spec angle_after_reference 는 --reference 기준 토크가 필요합니다.")
+
+    paths = collect_paths(args.targets, args.pattern, args.recursive)
+    if not paths:
+        logger.error("분석할 CSV 파일이 없습니다.")
+        return 1
+
+    settings = BatchSettings(
+        reference_torque=max(0.0, args.reference),
+        torque_range=(args.torque_min, args.torque_max),
+        angle_range=(args.angle_min, args.angle_max),
+        cache_dir=CACHE_DIR if args.cache else None,
+        spec_rules=spec_rules,
+    )
+
+    started = time.perf_counter()
+    rows = run_batch(paths, settings, args.workers)
+    elapsed = time.perf_counter() - started
+
+    if args.output is None:
+        write_summary(rows, sys.stdout)
+    else:
+        with args.output.open("w", encoding="utf-8-sig", newline="") as stream:
+            write_summary(rows, stream)
+
+    errors = sum(1 for row in rows if row["error"])
+    failed = sum(1 for row in rows if row["spec"] == "NG")
+    logger.info("%d개 파일 처리, 오류/경고 %d개, 규격 불합격 %d개, %.1f초", len(rows), errors, failed, elapsed)
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
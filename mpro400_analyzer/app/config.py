@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 CONFIG_DIR = Path.home() / ".mpro400_analyzer"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_DIR = CONFIG_DIR / "cache"
 
 
 def _apply_defaults(payload: Dict[str, Any]) -> Dict[str, Any]:
     defaults = {
         "show_onboarding": True,
         "last_dir": str(Path.home()),
+        "cache_enabled": True,
+        "cache_max_mb": 256,
+        "float32_curves": False,
+        "watch_window": 20,
+        "max_files": 1000,
+        "max_memory_mb": 1024,
+        "spec_rules": [],
+        "legend_outside": False,
     }
     merged = defaults.copy()
     merged.update(payload)
@@ -25,6 +34,16 @@ class AppConfig:
 
     show_onboarding: bool = True
     last_dir: str = str(Path.home())
+    cache_enabled: bool = True
+    cache_max_mb: int = 256
+    float32_curves: bool = False
+    watch_window: int = 20
+    max_files: int = 1000
+    max_memory_mb: int = 1024
+    # Pass/fail windows, e.g. {"kind": "peak_torque", "low": null, "high": 12.0}.
+    spec_rules: List[Dict[str, Any]] = field(default_factory=list)
+    # Legend to the right of the plot instead of over a free corner.
+    legend_outside: bool = False
 
     @classmethod
     def load(cls, path: Path = CONFIG_FILE) -> "AppConfig":
@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 import logging
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -8,6 +9,7 @@ if __package__ is None or __package__ == "":
     sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 import matplotlib
+import numpy as np
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
@@ -16,8 +18,10 @@ from PySide6.QtGui import QPalette, QColor, QIcon
 
 
 
-from app.config import AppConfig
+from app.config import CACHE_DIR, AppConfig
+from data.curve_cache import CurveCache
 from data.data_manager import DataManager
+from data.spec import SpecRule
 from ui.main_window import MainWindow
 
 LOG_DIR = Path("logs")
@@ -88,7 +92,18 @@ def main() -> int:
     apply_stylesheet(app)
 
     config = AppConfig.load()
-    manager = DataManager()
+    cache = CurveCache(CACHE_DIR, config.cache_max_mb * 1024 * 1024) if config.cache_enabled else None
+    storage_dtype = np.float32 if config.float32_curves else np.float64
+    manager = DataManager(
+        cache=cache,
+        storage_dtype=storage_dtype,
+        max_files=config.max_files,
+        max_memory_mb=config.max_memory_mb,
+    )
+    try:
+        manager.set_spec_rules([SpecRule.from_dict(rule) for rule in config.spec_rules])
+    except (AttributeError, TypeError, ValueError) as exc:
+        logging.warning("Ignoring invalid spec_rules in config: %s", exc)
     window = MainWindow(manager, config)
 
     if ICON_PATH.exists():
@@ -99,9 +114,12 @@ def main() -> int:
     window.maybe_show_onboarding()
 
     exit_code = app.exec()
+    manager.shutdown()
     config.save()
     return int(exit_code)
 
 
 if __name__ == "__main__":
+    # Required in frozen builds when DataManager.LOAD_EXECUTOR is "process".
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -1,99 +1,264 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+import io
+import os
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .curve import Curve
+
 try:
     import chardet  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     chardet = None
 
+if TYPE_CHECKING:  # pragma: no cover - curve_cache imports this module
+    from .curve_cache import CurveCache
+
 METRIC_COLUMNS = ("Angle", "Torque")
 OPTIONAL_COLUMNS = ("Time", "Window ID")
+FALLBACK_ENCODING = "cp949"
+_DEFAULT_ENCODING = "utf-8-sig"
+ENCODING_SAMPLE_BYTES = 16 * 1024
+# Streaming and scanning give up on a file whose metadata block is longer
+# than this; MPRO400 headers are a few hundred bytes.
+HEADER_LIMIT_BYTES = 64 * 1024
+DEFAULT_CHUNK_ROWS = 200_000
 
 
 @dataclass
 class CsvData:
     path: Path
     metadata: Dict[str, str]
-    dataframe: pd.DataFrame
+    curve: Curve
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """Tabular view of :attr:`curve`, built on demand."""
+
+        return self.curve.to_dataframe()
+
+
+@dataclass
+class MetadataScan:
+    """Header-only summary of one export returned by :func:`scan_metadata`."""
+
+    path: Path
+    metadata: Dict[str, str]
+    size: int = 0
+    row_estimate: int = 0
+    error: Optional[str] = None
 
 
 class CsvFormatError(Exception):
     """Raised when the CSV structure does not match the documented contract."""
 
 
-def detect_encoding(path: Path) -> str:
-    """Best-effort encoding detection with sensible defaults."""
+EncodingKey = Tuple[str, int, int]
 
-    default_encoding = "utf-8-sig"
-    if chardet is None:
-        return default_encoding
+_ENCODING_CACHE: Dict[EncodingKey, str] = {}
+_DIRECTORY_HINTS: Dict[str, str] = {}
 
+
+def _encoding_key(path: Path) -> Optional[EncodingKey]:
     try:
-        raw = path.read_bytes()
+        stat = path.stat()
     except OSError:
-        return default_encoding
+        return None
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def _metadata_prefix(raw: bytes) -> bytes:
+    """Return the bytes in front of the ``Angle`` header, capped in size.
+
+    The measurement block of an MPRO400 export is plain ASCII, so the metadata
+    header is the only part worth feeding to the detector.
+    """
+
+    sample = raw[:ENCODING_SAMPLE_BYTES]
+    header = sample.find(b"\nAngle")
+    if header != -1:
+        return sample[: header + 1]
+    return sample
+
+
+def _accepts(sample: bytes, encoding: str) -> bool:
+    try:
+        sample.decode(encoding)
+    except (LookupError, UnicodeDecodeError):
+        return False
+    return True
+
+
+def _detect_encoding_from_bytes(raw: bytes) -> str:
+    sample = _metadata_prefix(raw)
+    if sample.isascii():
+        return _DEFAULT_ENCODING
+    if chardet is None:
+        return _DEFAULT_ENCODING
 
-    result = chardet.detect(raw)
+    result = chardet.detect(sample)
     encoding = result.get("encoding") if isinstance(result, dict) else None
     if not encoding:
-        return default_encoding
+        return _DEFAULT_ENCODING
     return encoding
 
 
-def _extract_metadata(lines: list[str]) -> Tuple[Dict[str, str], int]:
+def _resolve_encoding(path: Path, raw: bytes) -> str:
+    key = _encoding_key(path)
+    if key is not None and key in _ENCODING_CACHE:
+        return _ENCODING_CACHE[key]
+
+    hint = _DIRECTORY_HINTS.get(str(path.resolve().parent))
+    sample = _metadata_prefix(raw)
+    if hint is not None and not sample.isascii() and _accepts(sample, hint):
+        encoding = hint
+    else:
+        encoding = _detect_encoding_from_bytes(raw)
+
+    # Plain ASCII headers say nothing about the controller's code page.
+    remember_encoding(path, encoding, update_hint=not sample.isascii())
+    return encoding
+
+
+def remember_encoding(path: Path, encoding: str, update_hint: bool = True) -> None:
+    """Record ``encoding`` for ``path`` and, optionally, for its directory."""
+
+    key = _encoding_key(path)
+    if key is not None:
+        _ENCODING_CACHE[key] = encoding
+    if update_hint:
+        _DIRECTORY_HINTS[str(path.resolve().parent)] = encoding
+
+
+def clear_encoding_cache() -> None:
+    _ENCODING_CACHE.clear()
+    _DIRECTORY_HINTS.clear()
+
+
+def detect_encoding(path: Path) -> str:
+    """Best-effort encoding detection from the metadata prefix of ``path``."""
+
+    path = Path(path)
+    try:
+        with path.open("rb") as handle:
+            raw = handle.read(ENCODING_SAMPLE_BYTES)
+    except OSError:
+        return _DEFAULT_ENCODING
+
+    return _resolve_encoding(path, raw)
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    probe = "\nAngle;0,1"
+    try:
+        return probe.encode("ascii").decode(encoding) == probe
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _locate_header(raw: bytes, encoding: str) -> Tuple[Dict[str, str], int]:
+    """Collect metadata and return the byte offset of the ``Angle`` header row.
+
+    Only the metadata lines are decoded; the measurement block is left in
+    ``raw`` so the compiled parser can read it straight from memory.
+    """
+
     metadata: Dict[str, str] = {}
-    header_index = -1
+    offset = 0
+    size = len(raw)
+
+    while offset < size:
+        end = raw.find(b"\n", offset)
+        stop = size if end == -1 else end
+        if _read_metadata_line(raw[offset:stop], encoding, metadata):
+            return metadata, offset
+        offset = stop + 1
+
+    raise CsvFormatError("Angle/Torque header row not found")
+
+
+def _read_metadata_line(line: bytes, encoding: str, metadata: Dict[str, str]) -> bool:
+    """Add one metadata line to ``metadata``; ``True`` if it is the header row."""
+
+    parts = [part.strip() for part in line.decode(encoding).lstrip("\ufeff").split(";")]
+    if parts and parts[0].lower() == "angle":
+        return True
+    if parts and parts[0]:
+        metadata[parts[0]] = parts[1] if len(parts) > 1 else ""
+    return False
 
-    for idx, raw_line in enumerate(lines):
-        line = raw_line.strip()
-        if not line:
-            continue
-        parts = [part.strip() for part in raw_line.split(";")]
-        if parts and parts[0].lower() == "angle":
-            header_index = idx
-            break
-        if parts and parts[0]:
-            value = parts[1] if len(parts) > 1 else ""
-            metadata[parts[0]] = value
 
-    if header_index == -1:
-        raise CsvFormatError("Angle/Torque header row not found")
+def _read_measurements(raw: bytes, offset: int, encoding: str, engine: str) -> pd.DataFrame:
+    options = dict(sep=";", decimal=",", header=0, encoding=encoding, on_bad_lines="skip")
+    buffer = memoryview(raw)[offset:]
+    if engine == "c":
+        try:
+            return pd.read_csv(io.BytesIO(buffer), engine="c", **options)
+        except pd.errors.ParserError:
+            # Fall through to the more forgiving python engine.
+            pass
+    return pd.read_csv(io.BytesIO(buffer), engine="python", **options)
 
-    return metadata, header_index
 
+def load_csv(path: Path, engine: str = "c", cache: Optional[CurveCache] = None) -> CsvData:
+    """Parse an MPRO400 export with a single read of the file.
+
+    The metadata block is decoded line by line up to the ``Angle`` header and
+    the measurement block is parsed from the same in-memory buffer. ``engine``
+    selects the pandas parser; ``"python"`` keeps the slower legacy behaviour.
+    With a ``cache`` a hit skips encoding detection and parsing entirely.
+    """
 
-def load_csv(path: Path) -> CsvData:
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(path)
 
-    encoding = detect_encoding(path)
+    raw = path.read_bytes()
+    if cache is not None:
+        cached = cache.lookup(path, raw)
+        if cached is not None:
+            return cached
+
+    csv = _parse_bytes(path, raw, engine)
+    if cache is not None:
+        cache.store(path, raw, csv)
+    return csv
+
+
+def _parse_bytes(path: Path, raw: bytes, engine: str) -> CsvData:
+    encoding = _resolve_encoding(path, raw)
+    if not _is_ascii_compatible(encoding):
+        # UTF-16/32 exports cannot be split on raw newlines; normalise once.
+        try:
+            raw = raw.decode(encoding).encode("utf-8")
+            encoding = "utf-8"
+        except (LookupError, UnicodeError):
+            encoding = FALLBACK_ENCODING
+
     try:
-        text = path.read_text(encoding=encoding)
-    except (UnicodeDecodeError, OSError):
+        metadata, offset = _locate_header(raw, encoding)
+        df = _read_measurements(raw, offset, encoding, engine)
+    except UnicodeDecodeError:
         # Fall back to cp949 which is common for legacy MPRO exports.
-        encoding = "cp949"
-        text = path.read_text(encoding=encoding)
-
-    lines = text.splitlines()
-    metadata, header_index = _extract_metadata(lines)
-
-    df = pd.read_csv(
-        path,
-        sep=";",
-        decimal=",",
-        skiprows=header_index,
-        header=0,
-        encoding=encoding,
-        engine="python",
-        on_bad_lines="skip",
-    )
+        encoding = FALLBACK_ENCODING
+        metadata, offset = _locate_header(raw, encoding)
+        df = _read_measurements(raw, offset, encoding, engine)
+        remember_encoding(path, encoding)
+
+    df = _normalize_measurements(df)
 
+    metadata.setdefault("File", path.name)
+
+    return CsvData(path=path, metadata=metadata, curve=Curve.from_dataframe(df))
+
+
+def _normalize_measurements(df: pd.DataFrame) -> pd.DataFrame:
     df = df.rename(columns=lambda name: str(name).strip())
 
     missing = [col for col in METRIC_COLUMNS if col not in df.columns]
@@ -106,11 +271,163 @@ def load_csv(path: Path) -> CsvData:
     for optional in OPTIONAL_COLUMNS:
         if optional in df.columns and df[optional].dtype == object:
             cleaned = df[optional].astype(str).str.replace(",", ".")
-            df[optional] = pd.to_numeric(cleaned, errors="ignore")
+            df[optional] = pd.to_numeric(cleaned, errors="coerce")
+
+    return df.dropna(subset=list(METRIC_COLUMNS))
+
+
+def _read_header(handle: BinaryIO, path: Path) -> Tuple[Dict[str, str], int, str, bytes]:
+    """Read just enough of ``handle`` to parse the metadata block.
+
+    Returns the metadata, the byte offset of the ``Angle`` header row, the
+    encoding used to decode it and the bytes read so far. Each line is
+    decoded once as its block arrives, and at most ``HEADER_LIMIT_BYTES``
+    are read before the file is rejected.
+    """
+
+    prefix = b""
+    metadata: Dict[str, str] = {}
+    offset = 0  # start of the first line not decoded yet
+    encoding: Optional[str] = None
+    while True:
+        block = handle.read(ENCODING_SAMPLE_BYTES)
+        prefix += block
+        at_end = not block
+        if encoding is None:
+            encoding = _resolve_encoding(path, prefix)
+            if not _is_ascii_compatible(encoding):
+                raise CsvFormatError(f"Streaming is not supported for {encoding} exports")
+
+        while offset < len(prefix):
+            end = prefix.find(b"\n", offset)
+            if end == -1:
+                if not at_end:
+                    break  # incomplete line; wait for the next block
+                end = len(prefix)
+            try:
+                is_header = _read_metadata_line(prefix[offset:end], encoding, metadata)
+            except UnicodeDecodeError:
+                if encoding == FALLBACK_ENCODING:
+                    raise CsvFormatError(f"Cannot decode the metadata block as {encoding}")
+                # Same fallback as _parse_bytes; restart with cp949.
+                encoding = FALLBACK_ENCODING
+                remember_encoding(path, encoding)
+                metadata.clear()
+                offset = 0
+                continue
+            if is_header:
+                return metadata, offset, encoding, prefix
+            offset = end + 1
 
-    df = df.dropna(subset=list(METRIC_COLUMNS))
-    df = df.reset_index(drop=True)
+        if at_end:
+            raise CsvFormatError("Angle/Torque header row not found")
+        if len(prefix) >= HEADER_LIMIT_BYTES:
+            raise CsvFormatError(
+                f"Not an MPRO400 export: no Angle/Torque header in the first {HEADER_LIMIT_BYTES // 1024} KB"
+            )
+
+
+def iter_curve_chunks(
+    path: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    engine: str = "c",
+    dtype=np.float64,
+) -> Iterator[Curve]:
+    """Yield the measurement block of ``path`` as :class:`Curve` chunks.
+
+    Only the metadata header and one chunk of rows are held in memory at a
+    time. Each chunk has numeric coercion and ``dropna`` applied and rows with
+    a non-zero Window ID (reference window markers) removed, so concatenating
+    the chunks matches the rows :func:`load_csv` keeps for plotting.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+
+    with path.open("rb") as handle:
+        _metadata, offset, encoding, _prefix = _read_header(handle, path)
+        handle.seek(offset)
+        reader = pd.read_csv(
+            handle,
+            sep=";",
+            decimal=",",
+            header=0,
+            encoding=encoding,
+            encoding_errors="replace",
+            on_bad_lines="skip",
+            engine=engine,
+            chunksize=chunk_rows,
+        )
+        with reader:
+            for chunk in reader:
+                curve = Curve.from_dataframe(_normalize_measurements(chunk), dtype=dtype)
+                if curve.window_id is not None:
+                    window = curve.window_id
+                    curve = curve.take(np.isnan(window) | (window == 0))
+                if len(curve):
+                    yield curve
+
+
+def _average_line_length(sample: bytes) -> Optional[float]:
+    complete = sample.count(b"\n")
+    if complete == 0:
+        return None
+    return (sample.rfind(b"\n") + 1) / complete
+
+
+def _estimate_rows(handle: BinaryIO, prefix: bytes, offset: int, size: int) -> int:
+    """Extrapolate the data row count from the head and tail of the file.
+
+    Angle values grow in width over a tightening, so averaging line lengths
+    at both ends is noticeably closer than using the head alone.
+    """
+
+    header_end = prefix.find(b"\n", offset)
+    if header_end == -1:
+        return 0
+    head = prefix[header_end + 1 :]
+    body_bytes = size - (header_end + 1)
+    if len(head) >= body_bytes:
+        return head.count(b"\n") + (1 if head and not head.endswith(b"\n") else 0)
+
+    tail_bytes = min(ENCODING_SAMPLE_BYTES, body_bytes - len(head))
+    handle.seek(size - tail_bytes)
+    tail = handle.read(tail_bytes)
+    tail = tail[tail.find(b"\n") + 1 :]
+
+    lengths = [length for length in (_average_line_length(head), _average_line_length(tail)) if length]
+    if not lengths:
+        return 1
+    return int(round(body_bytes / (sum(lengths) / len(lengths))))
+
+
+def _scan_one(path: Path) -> MetadataScan:
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as handle:
+            metadata, offset, _encoding, prefix = _read_header(handle, path)
+            row_estimate = _estimate_rows(handle, prefix, offset, size)
+    except (OSError, UnicodeError, CsvFormatError) as exc:
+        return MetadataScan(path=path, metadata={}, error=str(exc))
 
     metadata.setdefault("File", path.name)
+    return MetadataScan(path=path, metadata=metadata, size=size, row_estimate=row_estimate)
+
+
+def scan_metadata(paths: Sequence[Path], workers: Optional[int] = None) -> List[MetadataScan]:
+    """Read only the metadata block of every path, in parallel.
+
+    Results keep the input order. Unreadable files are reported through
+    :attr:`MetadataScan.error` instead of raising, so one bad export does not
+    abort a scan over thousands of files.
+    """
 
-    return CsvData(path=path, metadata=metadata, dataframe=df)
+    paths = [Path(p) for p in paths]
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    workers = min(workers, len(paths))
+    if workers <= 1:
+        return [_scan_one(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_scan_one, paths))
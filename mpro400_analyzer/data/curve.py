@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def find_window_column(columns: Iterable[str]) -> Optional[str]:
+    """Return the column holding the MPRO400 window id, if any.
+
+    Exports spell it ``Window ID``, ``WindowID`` or plain ``Window`` depending
+    on the controller firmware.
+    """
+
+    window_col = None
+    for column in columns:
+        normalized = "".join(ch.lower() for ch in str(column) if ch.isalnum())
+        if not normalized:
+            continue
+        if normalized == "windowid":
+            return column
+        if normalized.startswith("windowid") and window_col is None:
+            window_col = column
+        elif normalized.startswith("window") and window_col is None:
+            window_col = column
+    return window_col
+
+
+def _as_array(values, dtype) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+class Curve:
+    """Angle/Torque samples of one tightening stored as contiguous arrays.
+
+    ``time`` and ``window_id`` are optional and ``None`` when the export does
+    not carry them. All arrays share one floating point ``dtype``.
+    """
+
+    __slots__ = ("angle", "torque", "time", "window_id")
+
+    def __init__(
+        self,
+        angle,
+        torque,
+        time=None,
+        window_id=None,
+        dtype=np.float64,
+    ) -> None:
+        self.angle = _as_array(angle, dtype)
+        self.torque = _as_array(torque, dtype)
+        self.time = None if time is None else _as_array(time, dtype)
+        self.window_id = None if window_id is None else _as_array(window_id, dtype)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, dtype=np.float64) -> "Curve":
+        def numeric(column: Optional[str]) -> Optional[np.ndarray]:
+            if column is None or column not in df.columns:
+                return None
+            return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)
+
+        return cls(
+            angle=numeric("Angle"),
+            torque=numeric("Torque"),
+            time=numeric("Time"),
+            window_id=numeric(find_window_column(df.columns)),
+            dtype=dtype,
+        )
+
+    def __len__(self) -> int:
+        return int(self.angle.size)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.angle.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self._arrays() if array is not None)
+
+    def astype(self, dtype) -> "Curve":
+        if np.dtype(dtype) == self.dtype:
+            return self
+        return Curve(self.angle, self.torque, self.time, self.window_id, dtype=dtype)
+
+    def take(self, index) -> "Curve":
+        """Return the rows selected by a slice, mask or index array.
+
+        Slices produce views of the underlying arrays; masks and index arrays
+        copy.
+        """
+
+        def pick(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+            return None if array is None else array[index]
+
+        curve = Curve.__new__(Curve)
+        curve.angle = self.angle[index]
+        curve.torque = self.torque[index]
+        curve.time = pick(self.time)
+        curve.window_id = pick(self.window_id)
+        return curve
+
+    def to_dataframe(self) -> pd.DataFrame:
+        columns = {"Angle": self.angle, "Torque": self.torque}
+        if self.time is not None:
+            columns["Time"] = self.time
+        if self.window_id is not None:
+            columns["Window ID"] = self.window_id
+        return pd.DataFrame(columns)
+
+    def _arrays(self):
+        return (self.angle, self.torque, self.time, self.window_id)
+
+
+__all__ = ["Curve", "find_window_column"]
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .csv_loader import CsvData
+from .curve import Curve
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_SUFFIX = ".npz"
+_META_KEY = "__meta__"
+_CURVE_FIELDS = ("angle", "torque", "time", "window_id")
+
+
+class CurveCache:
+    """Binary on-disk cache of parsed MPRO400 exports.
+
+    Entries are ``.npz`` archives of the :class:`Curve` arrays, named after a
+    digest of the absolute path, size, mtime and content hash of the source
+    file, so any change to the CSV produces a new key. Hits bump the entry's mtime and the oldest entries are
+    evicted once the directory grows beyond ``max_bytes``.
+
+    The directory size is tracked as a running total, measured once on the
+    first write, so a store only lists the directory when eviction is due.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self._total: Optional[int] = None
+        # Stores run concurrently from the load thread pool.
+        self._lock = threading.Lock()
+
+    def key_for(self, path: Path, raw: bytes) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        content = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        source = f"{CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{content}"
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=20).hexdigest()
+
+    def lookup(self, path: Path, raw: bytes) -> Optional[CsvData]:
+        """Return the cached data for ``path`` or ``None`` on a miss."""
+
+        key = self.key_for(path, raw)
+        if key is None:
+            return None
+        entry = self._entry(key)
+        if not entry.exists():
+            return None
+
+        try:
+            with np.load(entry, allow_pickle=False) as archive:
+                meta = json.loads(str(archive[_META_KEY]))
+                arrays = {name: archive[name] for name in _CURVE_FIELDS if name in archive.files}
+            curve = Curve(dtype=arrays["angle"].dtype, **arrays)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+            logger.warning("Discarding unreadable cache entry %s: %s", entry.name, exc)
+            with self._lock:
+                self._remove(entry)
+            return None
+
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return CsvData(path=path, metadata=dict(meta["metadata"]), curve=curve)
+
+    def store(self, path: Path, raw: bytes, csv: CsvData) -> None:
+        key = self.key_for(path, raw)
+        if key is None:
+            return
+
+        arrays: Dict[str, np.ndarray] = {}
+        for name in _CURVE_FIELDS:
+            values = getattr(csv.curve, name)
+            if values is not None:
+                arrays[name] = values
+        arrays[_META_KEY] = np.array(json.dumps({"metadata": csv.metadata}, ensure_ascii=False))
+
+        temp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(handle, "wb") as stream:
+                np.savez(stream, **arrays)
+                written = stream.tell()
+            entry = self._entry(key)
+            with self._lock:
+                if self._total is None:
+                    self._total = self.size_bytes()
+                replaced = self._stat_size(entry)
+                os.replace(temp_name, entry)
+                self._total += written - replaced
+                if self._total > self.max_bytes:
+                    self._evict()
+        except OSError as exc:
+            # Caching is an optimisation; a read-only or full disk is not fatal.
+            logger.warning("Could not write cache entry for %s: %s", path.name, exc)
+            if temp_name is not None:
+                self._discard(Path(temp_name))
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries():
+                self._discard(entry)
+            self._total = 0
+
+    def size_bytes(self) -> int:
+        return sum(self._stat_size(entry) for entry in self._entries())
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _entries(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return [entry for entry in self.directory.iterdir() if entry.suffix == _SUFFIX]
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until under ``max_bytes``.
+
+        Also resynchronises the running total with the directory, which
+        other processes may share.
+        """
+
+        stats = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in stats)
+        if total > self.max_bytes:
+            for _, size, entry in sorted(stats):
+                self._discard(entry)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._total = total
+
+    def _remove(self, entry: Path) -> None:
+        size = self._stat_size(entry)
+        self._discard(entry)
+        if self._total is not None and not entry.exists():
+            self._total = max(0, self._total - size)
+
+    @staticmethod
+    def _stat_size(entry: Path) -> int:
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _discard(entry: Path) -> None:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+__all__ = ["CurveCache", "DEFAULT_MAX_BYTES"]
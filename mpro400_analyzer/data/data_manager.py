@@ -1,13 +1,21 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import numpy as np
 
 from .csv_loader import CsvData, CsvFormatError, load_csv
+from .curve import Curve
+from .curve_cache import CurveCache
+from .envelope import Envelope, compute_envelope
+from .resample import AlignedCurve, AngleGrid, CurveResampler, ResampledCurves
+from .spec import SpecFeatures, SpecRule, SpecVerdict, verdicts
 
 DEFAULT_COLORS = [
     "#4aa8ff",
@@ -22,16 +30,89 @@ DEFAULT_COLORS = [
     "#48bfe3",
 ]
 LINE_STYLES = ["solid", "dash", "dot"]
+EXECUTOR_KINDS = ("process", "thread")
+
+# Kinds of per-dataset change reported by DataManager.take_changes, in
+# increasing order of redraw cost.
+CHANGE_STYLE = "style"
+CHANGE_VISIBILITY = "visibility"
+CHANGE_DATA = "data"
+_CHANGE_RANK = {CHANGE_STYLE: 0, CHANGE_VISIBILITY: 1, CHANGE_DATA: 2}
+
+ParseResult = Tuple[Path, Optional[CsvData], Optional[str]]
+
+
+def _angle_window(
+    angles: np.ndarray,
+    offset: float,
+    amin: Optional[float],
+    amax: Optional[float],
+) -> slice:
+    """Index window of ``angles - offset`` within ``[amin, amax]``.
+
+    ``angles`` must be strictly increasing. The raw angles are searched with
+    shifted bounds and the edges nudged so the result matches comparing the
+    subtracted float64 values exactly.
+    """
+
+    size = angles.size
+    lo, hi = 0, size
+    if amin is not None:
+        lo = int(np.searchsorted(angles, amin + offset, side="left"))
+        while lo > 0 and float(angles[lo - 1]) - offset >= amin:
+            lo -= 1
+        while lo < size and float(angles[lo]) - offset < amin:
+            lo += 1
+    if amax is not None:
+        hi = int(np.searchsorted(angles, amax + offset, side="right"))
+        while hi < size and float(angles[hi]) - offset <= amax:
+            hi += 1
+        while hi > 0 and float(angles[hi - 1]) - offset > amax:
+            hi -= 1
+    return slice(lo, max(lo, hi))
+
+
+def _path_key(path: Path) -> Path:
+    return Path(path).resolve()
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+@dataclass(eq=False)
+class PlotPayload:
+    """One series ready for plotting.
 
+    ``x`` and ``y`` are float64 arrays. When no reference offset or range
+    filter applies they are read-only views of the dataset's cached curve.
+    """
 
-@dataclass
-class PlotPayload:
     label: str
-    x: List[float]
-    y: List[float]
+    x: np.ndarray
+    y: np.ndarray
     color: str
     line_style: str
     reference_hit: bool
+    identifier: Optional[int] = None
+
+
+@dataclass
+class ChangeSet:
+    """Pending plot changes since the last :meth:`DataManager.take_changes`.
+
+    ``full`` means every payload must be rebuilt (datasets added or removed,
+    reference torque or ranges changed). Otherwise ``datasets`` maps the
+    identifiers that changed to one of the ``CHANGE_*`` kinds.
+    """
+
+    full: bool = False
+    datasets: Dict[int, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return self.full or bool(self.datasets)
 
 
 @dataclass
@@ -43,6 +124,22 @@ class DataSet:
     line_style: str = LINE_STYLES[0]
     reference_hit: bool = True
     error: Optional[str] = None
+    # Primary angle segment without reference-window rows; independent of
+    # reference torque, ranges and styling, so it is computed once per data.
+    segment: Optional[Curve] = field(default=None, init=False, repr=False, compare=False)
+    # Running maximum of ``segment.torque`` (NaN treated as -inf). It is
+    # non-decreasing, so the first sample reaching any reference torque is a
+    # binary search away.
+    running_peak: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    angle_sorted: bool = field(default=False, init=False, repr=False, compare=False)
+    # Spec verdict for the manager's current rules; ``None`` until evaluated.
+    verdict: Optional[SpecVerdict] = field(default=None, init=False, compare=False)
+
+    def replace_csv(self, csv: CsvData) -> None:
+        self.csv = csv
+        self.segment = None
+        self.running_peak = None
+        self.verdict = None
 
     @property
     def name(self) -> str:
@@ -52,56 +149,285 @@ class DataSet:
     def metadata(self) -> Dict[str, str]:
         return self.csv.metadata
 
+    @property
+    def curve(self) -> Curve:
+        return self.csv.curve
+
     @property
     def dataframe(self) -> pd.DataFrame:
         return self.csv.dataframe
 
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the curve and its cached derivatives."""
+
+        total = self.curve.nbytes
+        if self.segment is not None and self.segment.angle.base is None:
+            total += self.segment.nbytes
+        if self.running_peak is not None:
+            total += self.running_peak.nbytes
+        return total
+
+
+def _parse_path(path: Path, cache: Optional[CurveCache] = None) -> Tuple[Optional[CsvData], Optional[str]]:
+    # Per-file error boundary for every load path: one undecodable, locked
+    # or malformed file becomes a warning instead of ending the batch.
+    try:
+        return load_csv(path, cache=cache), None
+    except (OSError, UnicodeError, ValueError, CsvFormatError) as exc:
+        return None, f"{path.name}: {exc}"
+
+
+def _make_executor(kind: str, workers: int) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def parse_paths(
+    paths: Sequence[Path],
+    workers: Optional[int] = None,
+    executor: str = "thread",
+    cache: Optional[CurveCache] = None,
+    pool: Optional[Executor] = None,
+) -> Iterator[ParseResult]:
+    """Parse ``paths`` and yield ``(path, csv, warning)`` in input order.
+
+    ``workers`` of ``None`` uses one worker per CPU; ``0`` or ``1`` parses
+    serially in the calling thread. ``executor`` picks a thread pool (the
+    default; the C parser releases the GIL) or a process pool. An existing
+    ``pool`` is used as is and left running. ``cache`` is consulted before
+    parsing.
+    """
+
+    paths = [Path(p) for p in paths]
+    if executor not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown executor kind: {executor}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(paths))
+
+    if workers <= 1:
+        for path in paths:
+            csv, warning = _parse_path(path, cache)
+            yield path, csv, warning
+        return
+
+    owned = pool is None
+    if pool is None:
+        pool = _make_executor(executor, workers)
+    futures: List[Future] = [pool.submit(_parse_path, path, cache) for path in paths]
+    try:
+        for path, future in zip(paths, futures):
+            csv, warning = future.result()
+            yield path, csv, warning
+    finally:
+        # Drop queued files when the consumer stops early (e.g. a cancelled load).
+        for future in futures:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
 
-class DataManager:
-    MAX_FILES = 20
 
-    def __init__(self) -> None:
-        self._datasets: List[DataSet] = []
+class DataManager:
+    # Default limits; both can be overridden per instance. Loading stops at
+    # whichever is reached first.
+    MAX_FILES = 1000
+    MAX_MEMORY_MB = 1024
+    # Batches smaller than this are parsed serially; pool start-up would cost
+    # more than it saves.
+    PARALLEL_MIN_FILES = 4
+    # Threads: a spawned process pool re-imports the whole application per
+    # worker, which costs seconds on Windows builds.
+    LOAD_EXECUTOR = "thread"
+
+    def __init__(
+        self,
+        cache: Optional[CurveCache] = None,
+        storage_dtype=np.float64,
+        max_files: Optional[int] = None,
+        max_memory_mb: Optional[int] = None,
+    ) -> None:
+        self.cache = cache
+        # float32 halves the memory of every loaded curve at ~1e-4 deg resolution.
+        self.storage_dtype = np.dtype(storage_dtype)
+        self.max_files = max(1, int(max_files if max_files is not None else self.MAX_FILES))
+        memory_mb = max_memory_mb if max_memory_mb is not None else self.MAX_MEMORY_MB
+        self.max_memory_bytes = max(1, int(memory_mb)) * 1024 * 1024
+        # Insertion ordered, so iteration gives the load order.
+        self._datasets: Dict[int, DataSet] = {}
+        # The same file may be loaded more than once; ids in load order.
+        self._by_path: Dict[Path, List[int]] = {}
+        self._nbytes = 0
         self.reference_torque: float = 0.0
         self.torque_range: Tuple[Optional[float], Optional[float]] = (None, None)
         self.angle_range: Tuple[Optional[float], Optional[float]] = (None, None)
         self._id_counter = 0
         self.selected_id: Optional[int] = None
+        # Number of most recent curves kept while ingesting a watched folder;
+        # ``None`` keeps up to ``max_files``.
+        self.rolling_limit: Optional[int] = None
+        self._changes = ChangeSet()
+        # Bumped whenever the set of enabled curves or their data changes;
+        # together with the reference torque it keys the resampling cache.
+        self._data_revision = 0
+        self._resampler = CurveResampler(
+            state=lambda: (self._data_revision, self.reference_torque),
+            source=self.aligned_curves,
+        )
+        self._envelope: Optional[Tuple[ResampledCurves, Envelope]] = None
+        # ((data revision, reference torque), (start, stop)) of the last angle_grid().
+        self._grid_span: Optional[Tuple[Tuple[int, float], Tuple[float, float]]] = None
+        self.spec_rules: Tuple[SpecRule, ...] = ()
+        self._verdict_key: Optional[Tuple[Tuple[SpecRule, ...], float]] = None
+        # Parse pool shared by every load, created on first use.
+        self._pool: Optional[Executor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Loading & bookkeeping
     # ------------------------------------------------------------------
     def clear(self) -> None:
         self._datasets.clear()
+        self._by_path.clear()
+        self._nbytes = 0
+        self._data_revision += 1
         self._id_counter = 0
         self.selected_id = None
+        self._mark_all()
 
-    def load(self, paths: Sequence[Path], append: bool = False) -> List[str]:
+    def load(
+        self,
+        paths: Sequence[Path],
+        append: bool = False,
+        workers: Optional[int] = None,
+    ) -> List[str]:
         warnings: List[str] = []
         if not append:
             self.clear()
 
-        for raw_path in paths:
-            if len(self._datasets) >= self.MAX_FILES:
-                warnings.append("파일은 최대 20개까지만 불러올 수 있습니다.")
-                break
+        pending = [Path(p) for p in paths]
+        # Only parse as many files as can still be added; failed files free
+        # their slot for the next batch.
+        while pending and self.has_capacity():
+            capacity = self.max_files - len(self._datasets)
+            batch, pending = pending[:capacity], pending[capacity:]
+            for path, csv, warning in self.parse(batch, workers):
+                if csv is None:
+                    warnings.append(warning or "")
+                    continue
+                if self.add_csv(csv) is None:
+                    # Memory budget reached mid-batch; report the rest as not loaded.
+                    pending.insert(0, path)
+                    break
+
+        if pending:
+            warnings.append(self.limit_message())
 
-            path = Path(raw_path)
-            try:
-                csv = load_csv(path)
-            except (FileNotFoundError, CsvFormatError) as exc:
-                warnings.append(f"{path.name}: {exc}")
-                continue
+        return warnings
 
-            dataset = DataSet(
-                identifier=self._next_id(),
-                csv=csv,
-                color=self._color_for_index(len(self._datasets)),
-            )
-            self._datasets.append(dataset)
-            self.selected_id = dataset.identifier
+    def parse(self, paths: Sequence[Path], workers: Optional[int] = None) -> Iterator[ParseResult]:
+        """Parse ``paths`` without touching the dataset list.
+
+        Safe to call from a worker thread; results are added afterwards with
+        :meth:`add_csv`.
+        """
+
+        if workers is None and len(paths) < self.PARALLEL_MIN_FILES:
+            workers = 1
+        if workers is None:
+            workers = os.cpu_count() or 1
+        pool = self._shared_pool(workers) if min(workers, len(paths)) > 1 else None
+        return parse_paths(paths, workers, self.LOAD_EXECUTOR, self.cache, pool)
+
+    def _shared_pool(self, workers: int) -> Executor:
+        # Called from load worker threads as well as the GUI thread.
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = _make_executor(self.LOAD_EXECUTOR, workers)
+                self._pool_workers = workers
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the shared parse pool; it is recreated by the next load."""
+
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+    def has_capacity(self) -> bool:
+        return len(self._datasets) < self.max_files and self._nbytes < self.max_memory_bytes
+
+    def limit_message(self) -> str:
+        if len(self._datasets) >= self.max_files:
+            return f"파일은 최대 {self.max_files}개까지만 불러올 수 있습니다."
+        limit_mb = self.max_memory_bytes // (1024 * 1024)
+        return f"메모리 한도({limit_mb} MB)에 도달해 더 이상 파일을 불러올 수 없습니다."
 
-        return warnings
+    @property
+    def memory_in_use(self) -> int:
+        return self._nbytes
+
+    def add_csv(self, csv: CsvData) -> Optional[DataSet]:
+        if not self.has_capacity():
+            return None
+        csv.curve = csv.curve.astype(self.storage_dtype)
+        dataset = DataSet(
+            identifier=self._next_id(),
+            csv=csv,
+            color=self._color_for_index(len(self._datasets)),
+        )
+        self._primary_segment(dataset)
+        self._datasets[dataset.identifier] = dataset
+        self._by_path.setdefault(_path_key(csv.path), []).append(dataset.identifier)
+        self._nbytes += dataset.nbytes
+        self._data_revision += 1
+        self.selected_id = dataset.identifier
+        self._mark_all()
+        return dataset
+
+    def ingest(self, csv: CsvData) -> Tuple[Optional[DataSet], List[int]]:
+        """Add a newly arrived or modified file from a watched folder.
+
+        A file that is already loaded has its data replaced in place (keeping
+        colour, style and visibility). New files push out the oldest curves
+        once the rolling window is full. Returns the affected dataset and the
+        identifiers that were rolled off.
+        """
+
+        existing = self.dataset_for_path(csv.path)
+        if existing is not None:
+            csv.curve = csv.curve.astype(self.storage_dtype)
+            self._nbytes -= existing.nbytes
+            existing.replace_csv(csv)
+            existing.error = None
+            self._primary_segment(existing)
+            self._nbytes += existing.nbytes
+            self._data_revision += 1
+            self._mark(existing.identifier, CHANGE_DATA)
+            return existing, []
+
+        limit = self.max_files
+        if self.rolling_limit is not None:
+            limit = max(1, min(self.rolling_limit, self.max_files))
+
+        removed: List[int] = []
+        while self._datasets and (len(self._datasets) >= limit or self._nbytes >= self.max_memory_bytes):
+            oldest = next(iter(self._datasets))
+            self.remove(oldest)
+            removed.append(oldest)
+
+        return self.add_csv(csv), removed
+
+    def dataset_for_path(self, path: Path) -> Optional[DataSet]:
+        """Most recently loaded dataset for ``path``, if any."""
+
+        identifiers = self._by_path.get(_path_key(path))
+        return self._datasets.get(identifiers[-1]) if identifiers else None
 
     def _next_id(self) -> int:
         self._id_counter += 1
@@ -117,57 +443,234 @@ class DataManager:
     # ------------------------------------------------------------------
     def set_enabled(self, identifier: int, enabled: bool) -> None:
         dataset = self._find(identifier)
-        if dataset:
+        if dataset and dataset.enabled != enabled:
             dataset.enabled = enabled
+            self._data_revision += 1
+            self._mark(identifier, CHANGE_VISIBILITY)
 
     def set_color(self, identifier: int, color: str) -> None:
         dataset = self._find(identifier)
         if dataset:
             dataset.color = color
+            self._mark(identifier, CHANGE_STYLE)
 
     def set_line_style(self, identifier: int, style: str) -> None:
         if style not in LINE_STYLES:
             return
         dataset = self._find(identifier)
-        if dataset:
+        if dataset and dataset.line_style != style:
             dataset.line_style = style
+            self._mark(identifier, CHANGE_STYLE)
 
     def set_selected(self, identifier: Optional[int]) -> None:
         self.selected_id = identifier
 
     def remove(self, identifier: int) -> None:
-        dataset = self._find(identifier)
+        dataset = self._datasets.pop(identifier, None)
         if not dataset:
             return
-        self._datasets = [d for d in self._datasets if d.identifier != identifier]
+        key = _path_key(dataset.csv.path)
+        identifiers = self._by_path.get(key, [])
+        if identifier in identifiers:
+            identifiers.remove(identifier)
+        if not identifiers:
+            self._by_path.pop(key, None)
+        self._nbytes -= dataset.nbytes
+        self._data_revision += 1
         if self.selected_id == identifier:
-            self.selected_id = self._datasets[0].identifier if self._datasets else None
+            self.selected_id = next(iter(self._datasets), None)
+        self._mark_all()
 
     def update_reference(self, value: float) -> None:
-        self.reference_torque = max(0.0, float(value))
+        value = max(0.0, float(value))
+        if value != self.reference_torque:
+            self.reference_torque = value
+            self._mark_all()
 
     def update_ranges(
         self,
         torque: Tuple[Optional[float], Optional[float]],
         angle: Tuple[Optional[float], Optional[float]],
     ) -> None:
-        self.torque_range = torque
-        self.angle_range = angle
+        if (torque, angle) != (self.torque_range, self.angle_range):
+            self.torque_range = torque
+            self.angle_range = angle
+            self._mark_all()
+
+    def set_spec_rules(self, rules: Sequence[SpecRule]) -> None:
+        rules = tuple(rules)
+        if rules != self.spec_rules:
+            self.spec_rules = rules
+            self._mark_all()
+
+    def take_changes(self) -> ChangeSet:
+        """Return and reset the changes accumulated since the last call."""
+
+        changes, self._changes = self._changes, ChangeSet()
+        return changes
+
+    def _mark(self, identifier: int, kind: str) -> None:
+        if self._changes.full:
+            return
+        previous = self._changes.datasets.get(identifier)
+        if previous is None or _CHANGE_RANK[kind] > _CHANGE_RANK[previous]:
+            self._changes.datasets[identifier] = kind
+
+    def _mark_all(self) -> None:
+        self._changes = ChangeSet(full=True)
 
     # ------------------------------------------------------------------
     # Query APIs
     # ------------------------------------------------------------------
     def datasets(self) -> List[DataSet]:
-        return list(self._datasets)
+        return list(self._datasets.values())
+
+    def dataset(self, identifier: int) -> Optional[DataSet]:
+        return self._find(identifier)
 
     def selected_dataset(self) -> Optional[DataSet]:
         if self.selected_id is None:
             return None
         return self._find(self.selected_id)
 
+    def payload_for(self, identifier: int) -> Optional[PlotPayload]:
+        """Payload of one enabled dataset, for incremental plot updates."""
+
+        dataset = self._find(identifier)
+        if dataset is None or not dataset.enabled:
+            return None
+        return self._build_payload(dataset)
+
+    def aligned_curves(self) -> List[AlignedCurve]:
+        """Enabled curves with angles shifted by the reference alignment.
+
+        Unlike :meth:`plot_payloads` no range filter is applied. With a
+        reference torque set, curves that never reach it are left out: they
+        have no alignment point, and mixing them in unshifted would skew any
+        statistics across curves. Angles are finite and increasing, as
+        :func:`data.resample.resample_curves` requires.
+        """
+
+        curves: List[AlignedCurve] = []
+        for dataset in self._datasets.values():
+            if not dataset.enabled:
+                continue
+            segment = self._primary_segment(dataset)
+            if len(segment) == 0:
+                continue
+            offset, reference_hit = self._align(dataset)
+            if not reference_hit:
+                continue
+            angles = np.asarray(segment.angle, dtype=np.float64)
+            torque = np.asarray(segment.torque, dtype=np.float64)
+            if not dataset.angle_sorted:
+                keep = np.flatnonzero(np.isfinite(angles))
+                keep = keep[np.argsort(angles[keep], kind="stable")]
+                angles, torque = angles[keep], torque[keep]
+            curves.append((dataset.identifier, angles - offset, torque))
+        return curves
+
+    def angle_grid(self, points: int = 512) -> AngleGrid:
+        """Grid spanning every enabled curve after reference alignment.
+
+        Same span as ``AngleGrid.spanning(self.aligned_curves())``, but read
+        from each segment's end angles instead of copying the curves, and
+        cached on the same state token as the resampler.
+        """
+
+        token = (self._data_revision, self.reference_torque)
+        if self._grid_span is None or self._grid_span[0] != token:
+            self._grid_span = (token, self._angle_span())
+        start, stop = self._grid_span[1]
+        return AngleGrid(start, stop, points)
+
+    def _angle_span(self) -> Tuple[float, float]:
+        starts: List[float] = []
+        stops: List[float] = []
+        for dataset in self._datasets.values():
+            if not dataset.enabled:
+                continue
+            segment = self._primary_segment(dataset)
+            if len(segment) == 0:
+                continue
+            offset, reference_hit = self._align(dataset)
+            if not reference_hit:
+                continue
+            angles = segment.angle
+            if not dataset.angle_sorted:
+                angles = angles[np.isfinite(angles)]
+                if angles.size == 0:
+                    continue
+                first, last = float(angles.min()), float(angles.max())
+            else:
+                first, last = float(angles[0]), float(angles[-1])
+            starts.append(first - offset)
+            stops.append(last - offset)
+        if not starts:
+            return 0.0, 0.0
+        return min(starts), max(stops)
+
+    def resample(self, grid: AngleGrid) -> ResampledCurves:
+        """Enabled curves on ``grid`` as one 2-D array, cached until the
+        curves or the reference torque change."""
+
+        return self._resampler.resample(grid)
+
+    def evaluate_specs(self) -> Dict[int, SpecVerdict]:
+        """Spec verdicts of every dataset against :attr:`spec_rules`.
+
+        Verdicts are cached on the datasets and only recomputed, in one
+        vectorised pass, for datasets that lack one for the current rules
+        and reference torque.
+        """
+
+        datasets = list(self._datasets.values())
+        if not self.spec_rules:
+            self._verdict_key = None
+            for dataset in datasets:
+                dataset.verdict = None
+            return {}
+
+        key = (self.spec_rules, self.reference_torque)
+        if key != self._verdict_key:
+            self._verdict_key = key
+            for dataset in datasets:
+                dataset.verdict = None
+
+        pending = [dataset for dataset in datasets if dataset.verdict is None]
+        if pending:
+            # Without a reference there is nothing to measure the angle from;
+            # such rules fail as not checked rather than being skipped.
+            unchecked = ("angle_after_reference",) if self.reference_torque <= 0 else ()
+            features = SpecFeatures.from_rows([self._spec_row(dataset) for dataset in pending])
+            for dataset, verdict in zip(pending, verdicts(self.spec_rules, features, unchecked)):
+                dataset.verdict = verdict
+        return {dataset.identifier: dataset.verdict for dataset in datasets}
+
+    def envelope(self, points: int = 512) -> Optional[Envelope]:
+        """Statistics across all enabled, reference-aligned curves.
+
+        The grid spans the curves, clipped to the angle range filter. Returns
+        ``None`` when no enabled curve has data.
+        """
+
+        grid = self.angle_grid(points)
+        if grid.start == grid.stop:
+            return None
+        amin, amax = self.angle_range
+        start = grid.start if amin is None else max(grid.start, amin)
+        stop = grid.stop if amax is None else min(grid.stop, amax)
+        if start >= stop:
+            return None
+
+        resampled = self.resample(AngleGrid(start, stop, points))
+        if self._envelope is None or self._envelope[0] is not resampled:
+            self._envelope = (resampled, compute_envelope(resampled))
+        return self._envelope[1]
+
     def plot_payloads(self) -> List[PlotPayload]:
         payloads: List[PlotPayload] = []
-        for dataset in self._datasets:
+        for dataset in self._datasets.values():
             if not dataset.enabled:
                 continue
             payload = self._build_payload(dataset)
@@ -178,43 +681,57 @@ class DataManager:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _primary_segment(self, dataset: DataSet) -> Curve:
+        if dataset.segment is None:
+            dataset.segment = self._strip_reference_rows(dataset.curve)
+            torque = dataset.segment.torque
+            dataset.running_peak = np.maximum.accumulate(np.where(np.isnan(torque), -np.inf, torque))
+            # Segments are split wherever the angle stops increasing, so only
+            # NaN angles can break the ordering.
+            dataset.angle_sorted = not np.isnan(dataset.segment.angle).any()
+        return dataset.segment
+
     def _build_payload(self, dataset: DataSet) -> Optional[PlotPayload]:
-        df = self._strip_reference_rows(dataset.dataframe)
-        if df.empty:
+        curve = self._primary_segment(dataset)
+        if len(curve) == 0:
             dataset.error = "데이터가 비어 있습니다."
             return None
 
-        angles, reference_hit = self._correct_angles(df)
-        dataset.reference_hit = reference_hit
-        dataset.error = None if reference_hit or self.reference_torque <= 0 else "기준 토크 미달"
+        offset, reference_hit = self._align(dataset)
 
-        mask = pd.Series(True, index=df.index)
+        amin, amax = self.angle_range
+        if dataset.angle_sorted:
+            # Slice the angle range out of the increasing angles first so the
+            # remaining work is proportional to the selected window.
+            window = _angle_window(curve.angle, offset, amin, amax)
+            angles = np.asarray(curve.angle[window], dtype=np.float64)
+            torque = np.asarray(curve.torque[window], dtype=np.float64)
+            mask = None
+        else:
+            angles = np.asarray(curve.angle, dtype=np.float64)
+            torque = np.asarray(curve.torque, dtype=np.float64)
+            mask = np.ones(len(curve), dtype=bool)
+        if offset:
+            angles = angles - offset
+        if mask is not None:
+            if amin is not None:
+                mask &= angles >= amin
+            if amax is not None:
+                mask &= angles <= amax
 
         tmin, tmax = self.torque_range
-        if tmin is not None:
-            mask &= df["Torque"] >= tmin
-        if tmax is not None:
-            mask &= df["Torque"] <= tmax
-
-        amin, amax = self.angle_range
-        if amin is not None:
-            mask &= angles >= amin
-        if amax is not None:
-            mask &= angles <= amax
-
-        filtered_index = df.index[mask]
-        if filtered_index.empty:
-            return PlotPayload(
-                label=dataset.name,
-                x=[],
-                y=[],
-                color=dataset.color,
-                line_style=dataset.line_style,
-                reference_hit=reference_hit,
-            )
-
-        x_values = angles.loc[filtered_index].astype(float).tolist()
-        y_values = df.loc[filtered_index, "Torque"].astype(float).tolist()
+        if tmin is not None or tmax is not None:
+            torque_mask = np.ones(torque.size, dtype=bool) if mask is None else mask
+            if tmin is not None:
+                torque_mask &= torque >= tmin
+            if tmax is not None:
+                torque_mask &= torque <= tmax
+            mask = torque_mask
+
+        if mask is None or mask.all():
+            x_values, y_values = _readonly(angles), _readonly(torque)
+        else:
+            x_values, y_values = angles[mask], torque[mask]
 
         return PlotPayload(
             label=dataset.name,
@@ -223,93 +740,96 @@ class DataManager:
             color=dataset.color,
             line_style=dataset.line_style,
             reference_hit=reference_hit,
+            identifier=dataset.identifier,
         )
 
-    def _strip_reference_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        window_col = None
-        for column in df.columns:
-            normalized = ''.join(ch.lower() for ch in column if ch.isalnum())
-            if not normalized:
-                continue
-            if normalized == 'windowid':
-                window_col = column
-                break
-            if normalized.startswith('windowid') and window_col is None:
-                window_col = column
-            elif normalized.startswith('window') and window_col is None:
-                window_col = column
-
-        if window_col is not None:
-            window_values = pd.to_numeric(df[window_col], errors='coerce')
-            mask = window_values.isna() | (window_values == 0)
+    def _strip_reference_rows(self, curve: Curve) -> Curve:
+        if curve.window_id is not None:
+            window_values = curve.window_id
+            mask = np.isnan(window_values) | (window_values == 0)
             if not mask.all():
-                df = df.loc[mask].copy()
-
-        return self._select_primary_angle_segment(df)
-
+                curve = curve.take(mask)
 
-    def _select_primary_angle_segment(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df.empty or 'Angle' not in df.columns or 'Torque' not in df.columns:
-            return df
+        return self._select_primary_angle_segment(curve)
 
-        angles = pd.to_numeric(df['Angle'], errors='coerce')
-        if angles.isna().all():
-            return df
+    def _select_primary_angle_segment(self, curve: Curve) -> Curve:
+        if len(curve) == 0:
+            return curve
 
-        angle_values = angles.to_numpy()
-        if angle_values.size == 0:
-            return df
+        angle_values = curve.angle
+        if np.isnan(angle_values).all():
+            return curve
 
         decreases = np.where(np.diff(angle_values) <= 0)[0] + 1
         if decreases.size == 0:
-            return df
-
-        segments = []
-        start = 0
-        for stop in decreases:
-            segment = df.iloc[start:stop].copy()
-            if not segment.empty:
-                segments.append(segment)
-            start = int(stop)
-        tail = df.iloc[start:].copy()
-        if not tail.empty:
-            segments.append(tail)
-
-        if not segments:
-            return df
-
-        def segment_score(segment: pd.DataFrame) -> tuple:
-            torque = pd.to_numeric(segment['Torque'], errors='coerce')
-            if torque.isna().all():
-                return (0.0, len(segment))
-            torque_range = torque.max() - torque.min()
-            return (float(torque_range), len(segment))
-
-        primary = max(segments, key=segment_score)
-        return primary
-
-    def _correct_angles(self, df: pd.DataFrame) -> Tuple[pd.Series, bool]:
-        angles = df["Angle"].astype(float)
-        if self.reference_torque <= 0:
-            return angles, True
+            return curve
+
+        # Score every segment at once: torque span first, then length. fmax/fmin
+        # skip NaN like the pandas max/min they replace; an all-NaN segment
+        # scores a span of 0.
+        starts = np.concatenate(([0], decreases))
+        lengths = np.diff(np.append(starts, len(curve)))
+        spans = np.fmax.reduceat(curve.torque, starts) - np.fmin.reduceat(curve.torque, starts)
+        spans = np.where(np.isnan(spans), 0.0, spans)
+
+        # First segment with the widest span, ties broken by length, matching
+        # max() over (span, length) tuples.
+        candidates = spans == spans.max()
+        best = int(np.argmax(np.where(candidates, lengths, -1)))
+        start = int(starts[best])
+        return curve.take(slice(start, start + int(lengths[best])))
+
+    def _spec_row(self, dataset: DataSet) -> Tuple[float, float, float, float]:
+        """Quantities checked by spec rules, in ``RULE_KINDS`` order."""
+
+        segment = self._primary_segment(dataset)
+        if len(segment) == 0:
+            return (np.nan, np.nan, np.nan, np.nan)
+        peak = float(dataset.running_peak[-1])
+        final_angle = float(segment.angle[-1])
+        after_reference = np.nan
+        if self.reference_torque > 0:
+            offset, reference_hit = self._reference_offset(segment, dataset.running_peak)
+            if reference_hit:
+                after_reference = final_angle - offset
+        return (
+            float(segment.torque[-1]),
+            peak if np.isfinite(peak) else np.nan,
+            final_angle - float(segment.angle[0]),
+            after_reference,
+        )
+
+    def _align(self, dataset: DataSet) -> Tuple[float, bool]:
+        """Reference offset of ``dataset``, updating its hit/error status."""
+
+        offset, reference_hit = self._reference_offset(dataset.segment, dataset.running_peak)
+        dataset.reference_hit = reference_hit
+        dataset.error = None if reference_hit or self.reference_torque <= 0 else "기준 토크 미달"
+        return offset, reference_hit
 
-        hits = df[df["Torque"] >= self.reference_torque]
-        if hits.empty:
-            return angles, False
+    def _reference_offset(self, curve: Curve, running_peak: np.ndarray) -> Tuple[float, bool]:
+        """Angle to subtract so the reference torque crossing sits at 0 deg."""
+
+        if self.reference_torque <= 0:
+            return 0.0, True
 
-        angle0 = hits.iloc[0]["Angle"]
-        corrected = angles - angle0
-        return corrected, True
+        # First sample with torque >= reference, found in O(log n).
+        first = int(np.searchsorted(running_peak, self.reference_torque, side="left"))
+        if first >= running_peak.size:
+            return 0.0, False
+        return float(curve.angle[first]), True
 
     def _find(self, identifier: int) -> Optional[DataSet]:
-        for dataset in self._datasets:
-            if dataset.identifier == identifier:
-                return dataset
-        return None
+        return self._datasets.get(identifier)
 
 
 __all__ = [
+    "CHANGE_DATA",
+    "CHANGE_STYLE",
+    "CHANGE_VISIBILITY",
+    "ChangeSet",
     "DataManager",
+    "parse_paths",
     "DataSet",
     "PlotPayload",
     "LINE_STYLES",
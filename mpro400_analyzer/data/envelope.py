@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+import numpy as np
+
+from .resample import ResampledCurves
+
+OUTLIER_SIGMA = 2.5
+# Columns covered by fewer curves than this do not count towards outliers;
+# the spread there is not meaningful.
+_MIN_OUTLIER_SUPPORT = 3
+
+
+@dataclass
+class Envelope:
+    """Per-angle statistics across resampled curves.
+
+    Every array has the length of ``grid``; columns no curve covers are NaN.
+    ``outliers`` lists the identifiers of curves whose RMS distance from the
+    mean exceeds ``OUTLIER_SIGMA`` standard deviations.
+    """
+
+    grid: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    p5: np.ndarray
+    median: np.ndarray
+    p95: np.ndarray
+    curves: int = 0
+    outliers: List[int] = field(default_factory=list)
+
+
+def nan_quantiles(values: np.ndarray, quantiles: Sequence[float]) -> np.ndarray:
+    """Column-wise quantiles of a 2-D array, ignoring NaN.
+
+    Same result as ``np.nanpercentile(..., axis=0)`` with linear
+    interpolation, but done with one sort instead of a per-column pass.
+    Returns an array of shape ``(len(quantiles), columns)``.
+    """
+
+    ordered = np.sort(values, axis=0)  # NaN sorts last
+    count = np.count_nonzero(~np.isnan(values), axis=0)
+    result = np.full((len(quantiles), values.shape[1]), np.nan)
+    covered = count > 0
+    if not covered.any():
+        return result
+
+    columns = np.flatnonzero(covered)
+    last = (count[covered] - 1).astype(np.float64)
+    for row, quantile in enumerate(quantiles):
+        position = last * quantile
+        below = np.floor(position).astype(np.intp)
+        above = np.minimum(below + 1, count[covered] - 1)
+        weight = position - below
+        low = ordered[below, columns]
+        high = ordered[above, columns]
+        result[row, covered] = low + (high - low) * weight
+    return result
+
+
+def compute_envelope(resampled: ResampledCurves, outlier_sigma: float = OUTLIER_SIGMA) -> Envelope:
+    torque = resampled.torque
+    grid = resampled.grid
+    count = np.count_nonzero(~np.isnan(torque), axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        total = np.nansum(torque, axis=0)
+        mean = np.where(count > 0, total / count, np.nan)
+        deviation = torque - mean
+        variance = np.nansum(deviation * deviation, axis=0) / count
+        std = np.where(count > 0, np.sqrt(variance), np.nan)
+
+        supported = (count >= _MIN_OUTLIER_SUPPORT) & (std > 0)
+        z = deviation / np.where(supported, std, np.nan)
+        squared = z * z
+        points = np.count_nonzero(~np.isnan(squared), axis=1)
+        rms_z = np.sqrt(np.nansum(squared, axis=1) / points)
+
+    p5, median, p95 = nan_quantiles(torque, (0.05, 0.5, 0.95))
+    outliers = [
+        identifier
+        for identifier, score in zip(resampled.identifiers, rms_z)
+        if np.isfinite(score) and score > outlier_sigma
+    ]
+    return Envelope(
+        grid=grid,
+        count=count,
+        mean=mean,
+        std=std,
+        p5=p5,
+        median=median,
+        p95=p95,
+        curves=len(resampled),
+        outliers=outliers,
+    )
+
+
+__all__ = ["Envelope", "OUTLIER_SIGMA", "compute_envelope", "nan_quantiles"]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, List, Sequence, Tuple
+
+import numpy as np
+
+# (identifier, reference-aligned angles, torque) of one curve.
+AlignedCurve = Tuple[int, np.ndarray, np.ndarray]
+
+
+@dataclass(frozen=True)
+class AngleGrid:
+    """Evenly spaced angles shared by every resampled curve."""
+
+    start: float
+    stop: float
+    points: int = 512
+
+    def values(self) -> np.ndarray:
+        return np.linspace(self.start, self.stop, max(int(self.points), 1))
+
+    @classmethod
+    def spanning(cls, curves: Sequence[AlignedCurve], points: int = 512) -> "AngleGrid":
+        """Grid covering the union of the curves' angle spans."""
+
+        starts = [angles[0] for _, angles, _ in curves if angles.size]
+        stops = [angles[-1] for _, angles, _ in curves if angles.size]
+        if not starts:
+            return cls(0.0, 0.0, points)
+        return cls(float(min(starts)), float(max(stops)), points)
+
+
+@dataclass
+class ResampledCurves:
+    """Curves on a common grid: ``torque[i, j]`` belongs to ``identifiers[i]``
+    at ``grid[j]`` and is NaN where the curve does not cover that angle."""
+
+    grid: np.ndarray
+    identifiers: List[int]
+    torque: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+
+def resample_curves(curves: Sequence[AlignedCurve], grid: np.ndarray) -> ResampledCurves:
+    """Linearly resample ``curves`` onto ``grid`` with a single ``np.interp``.
+
+    Angles must be increasing and finite within each curve. Every curve is
+    shifted into its own disjoint angle band (offset by ``index * band``) so
+    the concatenation stays sorted and one interpolation call serves all of
+    them; the grid is shifted the same way for each row.
+    """
+
+    grid = np.asarray(grid, dtype=np.float64)
+    identifiers = [identifier for identifier, _, _ in curves]
+    torque = np.full((len(curves), grid.size), np.nan)
+    series = [(angles, values) for _, angles, values in curves]
+    usable = [index for index, (angles, _) in enumerate(series) if angles.size]
+    if not usable or grid.size == 0:
+        return ResampledCurves(grid=grid, identifiers=identifiers, torque=torque)
+
+    low = min(float(grid[0]), min(float(series[i][0][0]) for i in usable))
+    high = max(float(grid[-1]), max(float(series[i][0][-1]) for i in usable))
+    band = (high - low) + 1.0
+
+    shifts = np.arange(len(usable), dtype=np.float64) * band - low
+    xp = np.concatenate([series[i][0] for i in usable]).astype(np.float64)
+    xp += np.repeat(shifts, [series[i][0].size for i in usable])
+    fp = np.concatenate([series[i][1] for i in usable]).astype(np.float64, copy=False)
+    queries = grid[np.newaxis, :] + shifts[:, np.newaxis]
+    values = np.interp(queries.ravel(), xp, fp).reshape(len(usable), grid.size)
+
+    # np.interp bridges the gap between neighbouring curves; blank every
+    # grid point outside a curve's own span.
+    first = np.array([series[i][0][0] for i in usable])[:, np.newaxis]
+    last = np.array([series[i][0][-1] for i in usable])[:, np.newaxis]
+    values[(grid < first) | (grid > last)] = np.nan
+    torque[usable] = values
+    return ResampledCurves(grid=grid, identifiers=identifiers, torque=torque)
+
+
+class CurveResampler:
+    """Caches :func:`resample_curves` results per (data state, grid).
+
+    ``state`` returns a hashable token that changes whenever the aligned
+    curves would (datasets added, removed, toggled or the reference torque);
+    ``source`` supplies the aligned curves themselves.
+    """
+
+    MAX_ENTRIES = 8
+
+    def __init__(
+        self,
+        state: Callable[[], Hashable],
+        source: Callable[[], List[AlignedCurve]],
+    ) -> None:
+        self._state = state
+        self._source = source
+        self._cache: "OrderedDict[Hashable, ResampledCurves]" = OrderedDict()
+
+    def resample(self, grid: AngleGrid) -> ResampledCurves:
+        key = (self._state(), grid)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        result = resample_curves(self._source(), grid.values())
+        # Shared between callers, so keep it immutable.
+        result.torque.flags.writeable = False
+        self._cache[key] = result
+        while len(self._cache) > self.MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+__all__ = [
+    "AlignedCurve",
+    "AngleGrid",
+    "CurveResampler",
+    "ResampledCurves",
+    "resample_curves",
+]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Quantity each rule kind checks, per curve (primary segment):
+#   final_torque           torque at the final angle
+#   peak_torque            highest torque
+#   total_angle            final angle minus start angle
+#   angle_after_reference  final angle minus the angle where the reference
+#                          torque is first reached (needs a reference torque)
+RULE_KINDS = ("final_torque", "peak_torque", "total_angle", "angle_after_reference")
+
+RULE_LABELS = {
+    "final_torque": "Final torque",
+    "peak_torque": "Peak torque",
+    "total_angle": "Total angle",
+    "angle_after_reference": "Angle after reference",
+}
+
+
+@dataclass(frozen=True)
+class SpecRule:
+    """Pass window ``[low, high]`` for one quantity; either bound may be open."""
+
+    kind: str
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"알 수 없는 규격 항목: {self.kind}")
+        if self.low is None and self.high is None:
+            raise ValueError(f"규격 '{self.kind}'에 하한 또는 상한이 필요합니다.")
+
+    @property
+    def label(self) -> str:
+        return RULE_LABELS[self.kind]
+
+    @classmethod
+    def parse(cls, text: str) -> "SpecRule":
+        """Build a rule from ``kind:low:high``; leave a bound empty to open it."""
+
+        parts = text.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"규격 형식은 항목:하한:상한 입니다: {text}")
+        kind, low, high = (part.strip() for part in parts)
+        return cls(kind, float(low) if low else None, float(high) if high else None)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, object]) -> "SpecRule":
+        low = payload.get("low")
+        high = payload.get("high")
+        return cls(
+            str(payload.get("kind", "")),
+            None if low is None else float(low),
+            None if high is None else float(high),
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"kind": self.kind, "low": self.low, "high": self.high}
+
+
+@dataclass(frozen=True)
+class SpecVerdict:
+    """Outcome for one curve. ``failures`` lists failed rule kinds in rule
+    order; ``unchecked`` is the subset that could not be measured at all
+    (e.g. an angle after reference without a reference torque)."""
+
+    passed: bool
+    failures: Tuple[str, ...] = ()
+    unchecked: Tuple[str, ...] = ()
+
+    def summary(self) -> str:
+        if self.passed:
+            return "Spec OK"
+        labels = []
+        for kind in self.failures:
+            label = RULE_LABELS.get(kind, kind)
+            labels.append(f"{label} (not checked)" if kind in self.unchecked else label)
+        return "Spec NG: " + ", ".join(labels)
+
+
+@dataclass
+class SpecFeatures:
+    """Column arrays with one entry per curve; NaN where undefined."""
+
+    final_torque: np.ndarray
+    peak_torque: np.ndarray
+    total_angle: np.ndarray
+    angle_after_reference: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[float, float, float, float]]) -> "SpecFeatures":
+        table = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(RULE_KINDS))
+        return cls(*(np.ascontiguousarray(table[:, column]) for column in range(len(RULE_KINDS))))
+
+    def column(self, kind: str) -> np.ndarray:
+        return getattr(self, kind)
+
+
+_PASSED = SpecVerdict(True)
+
+
+def evaluate_rules(rules: Sequence[SpecRule], features: SpecFeatures) -> np.ndarray:
+    """Boolean ``(curves, rules)`` table; a NaN quantity fails its rule."""
+
+    size = features.final_torque.size
+    passed = np.ones((size, len(rules)), dtype=bool)
+    for index, rule in enumerate(rules):
+        values = features.column(rule.kind)
+        column = ~np.isnan(values)
+        if rule.low is not None:
+            column &= values >= rule.low
+        if rule.high is not None:
+            column &= values <= rule.high
+        passed[:, index] = column
+    return passed
+
+
+def verdicts(
+    rules: Sequence[SpecRule],
+    features: SpecFeatures,
+    unchecked: Sequence[str] = (),
+) -> List[SpecVerdict]:
+    """Verdict per curve. Rules of an ``unchecked`` kind fail every curve:
+    a spec that could not be checked must never count as passed."""
+
+    table = evaluate_rules(rules, features)
+    kinds = np.array([rule.kind for rule in rules], dtype=object)
+    not_checked = np.array([rule.kind in unchecked for rule in rules], dtype=bool)
+    table[:, not_checked] = False
+    skipped = tuple(dict.fromkeys(kinds[not_checked]))
+    results: List[SpecVerdict] = []
+    all_passed = table.all(axis=1)
+    for row, ok in enumerate(all_passed):
+        if ok:
+            results.append(_PASSED)
+        else:
+            results.append(SpecVerdict(False, tuple(kinds[~table[row]]), skipped))
+    return results
+
+
+__all__ = [
+    "RULE_KINDS",
+    "RULE_LABELS",
+    "SpecFeatures",
+    "SpecRule",
+    "SpecVerdict",
+    "evaluate_rules",
+    "verdicts",
+]
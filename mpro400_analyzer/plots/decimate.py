@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    return values.size < 2 or bool(np.all(values[1:] >= values[:-1]))
+
+
+def minmax_decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    x0: float,
+    x1: float,
+    columns: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series with sorted ``x`` to what ``columns`` pixels can show.
+
+    Only the part inside ``[x0, x1]`` (plus one neighbour on each side, so
+    the line still runs off the edge) is kept. Within every pixel column the
+    first, last, lowest and highest points survive, in their original order,
+    so peaks and drops render exactly as with the full data. NaN samples are
+    kept so gaps in the line stay gaps. Series that already fit are returned
+    as undecimated views.
+    """
+
+    lo = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x1, side="right")) + 1, x.size)
+    xs, ys = x[lo:hi], y[lo:hi]
+    columns = max(int(columns), 1)
+    if xs.size <= 4 * columns or not x1 > x0:
+        return xs, ys
+
+    width = (x1 - x0) / columns
+    bins = np.clip(np.floor((xs - x0) / width), -1, columns).astype(np.intp)
+    starts = np.flatnonzero(np.concatenate(([True], bins[1:] != bins[:-1])))
+    counts = np.diff(np.append(starts, xs.size))
+    ends = starts + counts - 1
+
+    index = np.arange(ys.size)
+    with np.errstate(invalid="ignore"):
+        lowest = np.repeat(np.fmin.reduceat(ys, starts), counts)
+        highest = np.repeat(np.fmax.reduceat(ys, starts), counts)
+    # A column of only NaN has no extreme; its sentinel index is dropped below.
+    first_low = np.minimum.reduceat(np.where(ys == lowest, index, ys.size), starts)
+    first_high = np.minimum.reduceat(np.where(ys == highest, index, ys.size), starts)
+    gaps = np.flatnonzero(np.isnan(ys))
+
+    keep = np.unique(np.concatenate((starts, ends, first_low, first_high, gaps)))
+    keep = keep[keep < ys.size]
+    return xs[keep], ys[keep]
+
+
+__all__ = ["is_sorted", "minmax_decimate"]
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 from matplotlib import font_manager, rcParams
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+from PySide6.QtCore import QTimer
 
 from data.data_manager import PlotPayload
+from data.envelope import Envelope
+from .decimate import is_sorted, minmax_decimate
 from .styles import to_matplotlib
 
 _KOREAN_FONT_CANDIDATES = (
@@ -20,6 +25,15 @@ _KOREAN_FONT_CANDIDATES = (
 )
 _FONT_INITIALIZED = False
 
+ENVELOPE_COLOR = "#2f6fd6"
+# Legend corners in order of preference when the legend sits inside the axes.
+_LEGEND_CORNERS = ("upper left", "upper right", "lower right", "lower left")
+# Pixel columns per series for the points the legend is checked against;
+# min/max decimation keeps about four points per column.
+_LEGEND_PROBE_COLUMNS = 75
+# Series key of the envelope median; dataset identifiers are positive.
+_MEDIAN_KEY = -1
+
 
 @dataclass
 class HoverSeriesInfo:
@@ -40,8 +54,13 @@ class HoverDetails:
 class _SeriesSnapshot:
     label: str
     color: str
+    # Finite points only, ordered by x, for hover lookup.
     xdata: np.ndarray
     ydata: np.ndarray
+    # Full-resolution data as drawn (NaN gaps kept), the source for decimation.
+    line_x: np.ndarray
+    line_y: np.ndarray
+    sorted_x: bool = False
 
 
 HoverCallback = Callable[[Optional[HoverDetails]], None]
@@ -71,6 +90,12 @@ _configure_korean_font()
 
 
 class Plotter:
+    # A legend with hundreds of entries is unreadable and expensive to lay
+    # out; beyond this many series it is left off.
+    MAX_LEGEND_ENTRIES = 20
+    # Mouse moves are handled at most once per display frame (~60 Hz).
+    MOTION_INTERVAL_MS = 16
+
     def __init__(self) -> None:
         self.figure = Figure(figsize=(6, 4), dpi=100)
         self.axes = self.figure.add_subplot(111)
@@ -79,13 +104,32 @@ class Plotter:
 
         self._hover_callback: Optional[HoverCallback] = None
         self._cursor_line = None
-        self._series_snapshots: List[_SeriesSnapshot] = []
+        self._series_snapshots: Dict[int, _SeriesSnapshot] = {}
+        self._lines: Dict[int, Line2D] = {}
+        self._empty_text: Optional[Text] = None
+        self._legend_loc = "upper left"
+        self._legend_outside = False
+        self._showing_envelope = False
+        # Inputs of the last tight_layout(); see _layout_key_now().
+        self._layout_key: Optional[Tuple] = None
+        # Axes pixels without the cursor, restored before each cursor move.
+        self._background = None
 
         self._motion_cid = self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
         self._leave_cid = self.canvas.mpl_connect("figure_leave_event", self._on_mouse_leave)
+        self._resize_cid = self.canvas.mpl_connect("resize_event", self._on_resize)
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+        self._xlim_cid: Optional[int] = None
 
-        self._init_axes()
-        self._init_cursor_line()
+        # Latest (xdata, canvas position) not yet handled by _process_motion.
+        self._pending_motion: Optional[Tuple[float, Tuple[int, int]]] = None
+        self._motion_timer = QTimer(self.canvas)
+        self._motion_timer.setSingleShot(True)
+        self._motion_timer.setInterval(self.MOTION_INTERVAL_MS)
+        self._motion_timer.timeout.connect(self._process_motion)
+
+        self._reset_axes()
+        self._empty_text.set_visible(False)
 
     def widget(self) -> FigureCanvasQTAgg:
         return self.canvas
@@ -93,66 +137,198 @@ class Plotter:
     def set_hover_callback(self, callback: Optional[HoverCallback]) -> None:
         self._hover_callback = callback
 
+    def set_legend_outside(self, outside: bool) -> None:
+        """Put the legend to the right of the axes instead of on top of the data."""
+
+        if outside == self._legend_outside:
+            return
+        self._legend_outside = outside
+        if self._lines:
+            self._finish_draw()
+
     def draw(self, payloads: Iterable[PlotPayload]) -> None:
+        """Show exactly ``payloads``, reusing the lines of the last draw.
+
+        Series already on the axes are updated in place; only lines for new
+        series are created and lines for series that are gone are removed.
+        The axes are rebuilt from scratch only when coming from the envelope
+        view or when the series order changed.
+        """
+
+        keyed = [
+            (payload.identifier if payload.identifier is not None else -(index + 1), payload)
+            for index, payload in enumerate(payloads)
+        ]
+        if not self._can_reuse([key for key, _ in keyed]):
+            self._reset_axes()
+
+        previous = self._lines
+        self._lines = {}
+        self._series_snapshots = {}
+        for key, payload in keyed:
+            line = previous.pop(key, None)
+            if line is None:
+                self._add_series(key, payload)
+                continue
+            snapshot = self._snapshot(payload)
+            line.set_data(*self._level_of_detail(snapshot))
+            self._style_line(line, payload)
+            self._lines[key] = line
+            self._series_snapshots[key] = snapshot
+        for line in previous.values():
+            line.remove()
+
+        # A toolbar zoom turns autoscaling off; a redraw shows all data again,
+        # as it did when the axes were cleared.
+        self.axes.set_autoscale_on(True)
+        self.axes.relim(visible_only=True)
+        self.axes.autoscale_view()
+        self._finish_draw()
+
+    def _can_reuse(self, keys: List[int]) -> bool:
+        # Lines are drawn in creation order, so kept series must come first
+        # and in their old order; new series can only be appended.
+        if self._showing_envelope:
+            return False
+        wanted = set(keys)
+        kept = [key for key in self._lines if key in wanted]
+        return keys[: len(kept)] == kept
+
+    def draw_envelope(self, envelope: Envelope, outliers: Iterable[PlotPayload] = ()) -> None:
+        """Draw the P5-P95 band and median of ``envelope`` instead of every curve.
+
+        The cost is one ``fill_between`` and one line regardless of how many
+        curves the envelope summarises. ``outliers`` are drawn on top as
+        ordinary series.
+        """
+
+        self._reset_axes()
+        self._showing_envelope = True
+        grid = envelope.grid
+        band = self.axes.fill_between(
+            grid,
+            envelope.p5,
+            envelope.p95,
+            color=ENVELOPE_COLOR,
+            alpha=0.25,
+            linewidth=0,
+            label=f"P5–P95 ({envelope.curves})",
+        )
+        band.set_gid("envelope-band")
+        median = PlotPayload(
+            label="Median",
+            x=grid,
+            y=envelope.median,
+            color=ENVELOPE_COLOR,
+            line_style="solid",
+            reference_hit=True,
+        )
+        self._add_series(_MEDIAN_KEY, median)
+        for index, payload in enumerate(outliers):
+            key = payload.identifier if payload.identifier is not None else -(index + 2)
+            self._add_series(key, payload)
+        self._finish_draw()
+
+    def _reset_axes(self) -> None:
         self.axes.clear()
+        # axes.clear() drops callbacks registered on the axes.
+        self._xlim_cid = self.axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
         self._init_axes()
         self._init_cursor_line()
-        self._series_snapshots.clear()
-
-        plotted = False
-
-        for payload in payloads:
-            linestyle = to_matplotlib(payload.line_style)
-            line_color = payload.color
-
-            line, = self.axes.plot(
-                payload.x,
-                payload.y,
-                linestyle=linestyle,
-                color=line_color,
-                linewidth=1.8,
-                label=payload.label,
-                alpha=1.0 if payload.reference_hit else 0.5,
-            )
-
-            xdata = np.asarray(line.get_xdata(), dtype=float)
-            ydata = np.asarray(line.get_ydata(), dtype=float)
-            mask = np.isfinite(xdata) & np.isfinite(ydata)
-            if mask.any():
-                snapshot = _SeriesSnapshot(
-                    label=payload.label,
-                    color=line_color,
-                    xdata=xdata[mask],
-                    ydata=ydata[mask],
-                )
-                self._series_snapshots.append(snapshot)
-                plotted = plotted or snapshot.xdata.size > 0
-            else:
-                self._series_snapshots.append(
-                    _SeriesSnapshot(label=payload.label, color=line_color, xdata=np.array([]), ydata=np.array([]))
-                )
-
+        self._empty_text = self.axes.text(
+            0.5,
+            0.5,
+            "No data to display",
+            ha="center",
+            va="center",
+            transform=self.axes.transAxes,
+            color="#333333",
+        )
+        self._series_snapshots = {}
+        self._lines = {}
+        self._showing_envelope = False
+
+    def _add_series(self, key: int, payload: PlotPayload) -> None:
+        snapshot = self._snapshot(payload)
+        line, = self.axes.plot(*self._level_of_detail(snapshot), linewidth=1.8)
+        self._style_line(line, payload)
+        self._lines[key] = line
+        self._series_snapshots[key] = snapshot
+
+    @staticmethod
+    def _style_line(line: Line2D, payload: PlotPayload) -> None:
+        line.set_label(payload.label)
+        line.set_color(payload.color)
+        line.set_linestyle(to_matplotlib(payload.line_style))
+        line.set_alpha(1.0 if payload.reference_hit else 0.5)
+        line.set_visible(True)
+
+    def _finish_draw(self) -> None:
         handles, labels = self.axes.get_legend_handles_labels()
-        self._place_legend(handles, labels)
-
-        if not plotted:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data to display",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color="#333333",
-            )
-
-        self.figure.tight_layout()
+        shown = [(handle, label) for handle, label in zip(handles, labels) if handle.get_visible()]
+        handles = [handle for handle, _ in shown]
+        labels = [label for _, label in shown]
+        self._legend_loc = "upper left"
+        legend = self._make_legend(handles, labels)
+        self._empty_text.set_visible(not self._has_data())
+
+        self._relayout(labels if legend is not None else [])
+        if legend is not None and not self._legend_outside:
+            self._place_legend(legend, handles, labels)
+        self._background = None
         self.canvas.draw_idle()
         self._hide_cursor()
         self._notify_hover(None)
 
+    def update_series(self, payload: PlotPayload) -> None:
+        """Show ``payload`` by updating its existing line in place.
+
+        Falls back to adding a new line when the series was not part of the
+        last :meth:`draw`. Axis limits are recomputed from visible lines.
+        """
+
+        line = self._lines.get(payload.identifier)
+        if line is None:
+            self._add_series(payload.identifier, payload)
+        else:
+            snapshot = self._snapshot(payload)
+            line.set_data(*self._level_of_detail(snapshot))
+            self._style_line(line, payload)
+            self._series_snapshots[payload.identifier] = snapshot
+        self._finish_update(rescale=True)
+
+    def hide_series(self, identifier: int) -> None:
+        line = self._lines.get(identifier)
+        if line is None or not line.get_visible():
+            return
+        line.set_visible(False)
+        snapshot = self._series_snapshots.get(identifier)
+        if snapshot is not None:
+            # Keep the entry so hover order stays stable when it is re-enabled.
+            snapshot.xdata = snapshot.ydata = np.array([])
+        self._finish_update(rescale=True)
+
+    def restyle_series(self, identifier: int, color: str, line_style: str) -> None:
+        line = self._lines.get(identifier)
+        if line is None:
+            return
+        line.set_color(color)
+        line.set_linestyle(to_matplotlib(line_style))
+        snapshot = self._series_snapshots.get(identifier)
+        if snapshot is not None:
+            snapshot.color = color
+        self._finish_update(rescale=False)
+
     def save(self, path: str, dpi: int = 150) -> None:
-        self.figure.savefig(path, dpi=dpi, facecolor=self.figure.get_facecolor())
+        # Export at full resolution; decimation is tuned to the screen.
+        for key, line in self._lines.items():
+            snapshot = self._series_snapshots.get(key)
+            if snapshot is not None:
+                line.set_data(snapshot.line_x, snapshot.line_y)
+        try:
+            self.figure.savefig(path, dpi=dpi, facecolor=self.figure.get_facecolor())
+        finally:
+            self._redecimate()
 
     def _init_axes(self) -> None:
         self.axes.set_xlabel("Angle (deg)")
@@ -170,45 +346,221 @@ class Plotter:
     def _init_cursor_line(self) -> None:
         if self._cursor_line is not None and self._cursor_line.axes is not None:
             self._cursor_line.remove()
-        self._cursor_line = self.axes.axvline(color="#36435a", linewidth=1.2, alpha=0.7)
+        # Animated: full draws leave it out and it is blitted on its own.
+        self._cursor_line = self.axes.axvline(
+            color="#36435a", linewidth=1.2, alpha=0.7, animated=True
+        )
         self._cursor_line.set_visible(False)
 
-    def _place_legend(self, handles, labels) -> None:
-        if not labels:
+    @staticmethod
+    def _snapshot(payload: PlotPayload) -> _SeriesSnapshot:
+        line_x = np.asarray(payload.x, dtype=float)
+        line_y = np.asarray(payload.y, dtype=float)
+        xdata, ydata = line_x, line_y
+        mask = np.isfinite(xdata) & np.isfinite(ydata)
+        if not mask.all():
+            xdata, ydata = xdata[mask], ydata[mask]
+        if not is_sorted(xdata):
+            # Stable, so equal angles keep their original order.
+            order = np.argsort(xdata, kind="stable")
+            xdata, ydata = xdata[order], ydata[order]
+        return _SeriesSnapshot(
+            label=payload.label,
+            color=payload.color,
+            xdata=xdata,
+            ydata=ydata,
+            line_x=line_x,
+            line_y=line_y,
+            sorted_x=bool(np.isfinite(line_x).all()) and is_sorted(line_x),
+        )
+
+    def _level_of_detail(
+        self,
+        snapshot: _SeriesSnapshot,
+        xlim: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Data for ``snapshot`` decimated to the axes width in pixels.
+
+        Without ``xlim`` the series' own extent is used, which is never
+        coarser than the final view.
+        """
+
+        x, y = snapshot.line_x, snapshot.line_y
+        if not snapshot.sorted_x or x.size < 2:
+            return x, y
+        x0, x1 = xlim if xlim is not None else (x[0], x[-1])
+        columns = int(self.axes.bbox.width) or 1
+        return minmax_decimate(x, y, min(x0, x1), max(x0, x1), columns)
+
+    def _redecimate(self) -> None:
+        xlim = self.axes.get_xlim()
+        for key, line in self._lines.items():
+            snapshot = self._series_snapshots.get(key)
+            if snapshot is not None and snapshot.sorted_x:
+                line.set_data(*self._level_of_detail(snapshot, xlim))
+
+    def _on_xlim_changed(self, _axes) -> None:
+        # Zoom and pan (toolbar or autoscale) re-decimate the visible range.
+        self._background = None
+        self._redecimate()
+
+    def _on_resize(self, _event) -> None:
+        self._background = None
+        self._redecimate()
+
+    def _on_draw(self, _event) -> None:
+        if not self.canvas.supports_blit:
             return
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+        if self._cursor_line.get_visible():
+            self.axes.draw_artist(self._cursor_line)
+            self.canvas.blit(self.axes.bbox)
 
-        legend = self.axes.legend(handles, labels, loc="upper left")
-        self.canvas.draw()
-        renderer = self.canvas.get_renderer()
-        if renderer is not None:
-            legend_bbox = legend.get_window_extent(renderer=renderer)
-            if self._legend_overlaps_data(legend_bbox):
-                legend.remove()
-                legend = self.axes.legend(handles, labels, loc="best")
+    def _blit_cursor(self) -> None:
+        """Repaint only the cursor over the cached background.
 
-        self._style_legend(legend)
+        Without a background (nothing drawn yet, or it went stale after a
+        data, zoom or size change) a normal draw is queued instead; its
+        draw event caches a fresh background and paints the cursor.
+        """
 
-    def _legend_overlaps_data(self, legend_bbox) -> bool:
-        for line in self.axes.lines:
-            if not line.get_visible():
-                continue
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if self._cursor_line.get_visible():
+            self.axes.draw_artist(self._cursor_line)
+        self.canvas.blit(self.axes.bbox)
+
+    def _layout_key_now(self, legend_labels: List[str]) -> Tuple:
+        """What tight_layout() depends on, short of rendering the figure.
+
+        Canvas size, axis labels, the widest y tick label (the y tick
+        labels are what usually change the left margin between draws) and,
+        with the legend outside the axes, the legend entries.
+        """
+
+        self.axes.get_ylim()  # apply any pending autoscale
+        yaxis = self.axes.yaxis
+        ticks = yaxis.get_major_formatter().format_ticks(yaxis.get_majorticklocs())
+        return (
+            self.canvas.width(),
+            self.canvas.height(),
+            self.axes.get_xlabel(),
+            self.axes.get_ylabel(),
+            max((len(text) for text in ticks), default=0),
+            tuple(legend_labels) if self._legend_outside else None,
+        )
+
+    def _has_data(self) -> bool:
+        return any(snapshot.xdata.size > 0 for snapshot in self._series_snapshots.values())
+
+    def _finish_update(self, rescale: bool) -> None:
+        if rescale:
+            self.axes.relim(visible_only=True)
+            self.axes.autoscale_view()
+        legend_labels = self._refresh_legend()
+        if self._empty_text is not None:
+            self._empty_text.set_visible(not self._has_data())
+        # An outside legend that appears, disappears or changes width needs
+        # its margin resized; so does a rescale that widens the tick labels.
+        self._relayout(legend_labels)
+        self._background = None
+        self.canvas.draw_idle()
 
-            xdata = np.asarray(line.get_xdata(), dtype=float)
-            ydata = np.asarray(line.get_ydata(), dtype=float)
-            if xdata.size == 0 or ydata.size == 0:
-                continue
+    def _relayout(self, legend_labels: List[str]) -> None:
+        """Run tight_layout() unless nothing it depends on has changed."""
 
-            step = max(1, xdata.size // 300)
-            sample = np.column_stack((xdata[::step], ydata[::step]))
-            if sample.size == 0:
-                continue
+        layout_key = self._layout_key_now(legend_labels)
+        if layout_key != self._layout_key:
+            self.figure.tight_layout()
+            self._layout_key = layout_key
+
+    def _refresh_legend(self) -> List[str]:
+        """Rebuild the legend from visible lines at the last chosen location.
+
+        Returns the labels listed, empty when no legend is shown.
+        """
 
-            display_points = self.axes.transData.transform(sample)
-            for x, y in display_points:
-                if legend_bbox.contains(x, y):
-                    return True
+        handles = [line for line in self._lines.values() if line.get_visible()]
+        labels = [line.get_label() for line in handles]
+        return labels if self._make_legend(handles, labels) is not None else []
 
-        return False
+    def _make_legend(self, handles, labels):
+        """Replace the legend with one for ``handles`` at ``_legend_loc``.
+
+        Returns ``None`` when there is nothing to list or too much to list.
+        """
+
+        legend = self.axes.get_legend()
+        if legend is not None:
+            legend.remove()
+        if not labels or len(labels) > self.MAX_LEGEND_ENTRIES:
+            return None
+        if self._legend_outside:
+            legend = self.axes.legend(
+                handles, labels, loc="upper left", bbox_to_anchor=(1.02, 1.0), borderaxespad=0.0
+            )
+        else:
+            legend = self.axes.legend(handles, labels, loc=self._legend_loc)
+        self._style_legend(legend)
+        return legend
+
+    def _place_legend(self, legend, handles, labels) -> None:
+        """Move ``legend`` to the first corner where it covers no data.
+
+        The legend box is measured with the renderer alone, without drawing
+        the figure, and mirrored into the other corners. Every corner is
+        tested against the same probe points in one vectorized comparison;
+        when all of them cover data the least covered one wins.
+        """
+
+        points = self._legend_probe_points()
+        if points.size == 0:
+            return
+        box = legend.get_window_extent(renderer=self.canvas.get_renderer())
+        area = self.axes.bbox
+        left_pad = box.x0 - area.x0
+        top_pad = area.y1 - box.y1
+        lefts = {"left": box.x0, "right": area.x1 - left_pad - box.width}
+        bottoms = {"upper": box.y0, "lower": area.y0 + top_pad}
+
+        corners = [(loc, *loc.split()) for loc in _LEGEND_CORNERS]
+        x0 = np.array([lefts[side] for _, _, side in corners])
+        y0 = np.array([bottoms[level] for _, level, _ in corners])
+        px, py = points[:, :1], points[:, 1:]
+        inside = (px >= x0) & (px <= x0 + box.width) & (py >= y0) & (py <= y0 + box.height)
+        covered = np.count_nonzero(inside, axis=0)
+
+        loc = _LEGEND_CORNERS[int(np.argmin(covered))]  # first minimum: preference order
+        if loc != self._legend_loc:
+            self._legend_loc = loc
+            self._make_legend(handles, labels)
+
+    def _legend_probe_points(self) -> np.ndarray:
+        """Display coordinates of the visible series, a few hundred per series.
+
+        Built from the drawn data, which is already decimated to the axes
+        width, so the cost does not grow with the number of samples. NaN
+        samples are dropped; they cannot be covered.
+        """
+
+        chunks = []
+        for key, line in self._lines.items():
+            snapshot = self._series_snapshots.get(key)
+            if snapshot is None or not line.get_visible() or snapshot.xdata.size == 0:
+                continue
+            x, y = (np.asarray(values, dtype=float) for values in line.get_data())
+            if snapshot.sorted_x and x.size > 1:
+                x, y = minmax_decimate(x, y, x[0], x[-1], _LEGEND_PROBE_COLUMNS)
+            else:
+                step = max(1, x.size // (4 * _LEGEND_PROBE_COLUMNS))
+                x, y = x[::step], y[::step]
+            finite = np.isfinite(x) & np.isfinite(y)
+            chunks.append(np.column_stack((x[finite], y[finite])))
+        if not chunks:
+            return np.empty((0, 2))
+        return self.axes.transData.transform(np.concatenate(chunks))
 
     def _style_legend(self, legend) -> None:
         if legend is None:
@@ -220,59 +572,75 @@ class Plotter:
         frame.set_edgecolor("#bdc7d6")
 
     def _on_mouse_move(self, event) -> None:
-        if event.inaxes != self.axes or not self._series_snapshots:
-            self._hide_cursor()
-            self._notify_hover(None)
-            return
-
-        if event.xdata is None:
+        if event.inaxes != self.axes or event.xdata is None or not self._series_snapshots:
+            self._pending_motion = None
             self._hide_cursor()
             self._notify_hover(None)
             return
 
-        hover_entries: List[HoverSeriesInfo] = []
-        for snapshot in self._series_snapshots:
-            if snapshot.xdata.size == 0:
-                continue
+        # Qt owns guiEvent only for the duration of this handler, so the
+        # position is taken now and the lookup runs when the timer fires.
+        if event.guiEvent is not None and hasattr(event.guiEvent, "position"):
+            qt_pos = event.guiEvent.position()
+            canvas_pos = (int(qt_pos.x()), int(qt_pos.y()))
+        else:
+            canvas_height = self.canvas.height()
+            canvas_pos = (int(event.x), int(canvas_height - event.y))
+        self._pending_motion = (float(event.xdata), canvas_pos)
+        if not self._motion_timer.isActive():
+            self._motion_timer.start()
 
-            idx = int(np.argmin(np.abs(snapshot.xdata - event.xdata)))
-            x_val = float(snapshot.xdata[idx])
-            y_val = float(snapshot.ydata[idx])
-            if not np.isfinite(x_val) or not np.isfinite(y_val):
-                continue
-            hover_entries.append(
-                HoverSeriesInfo(label=snapshot.label, color=snapshot.color, x=x_val, y=y_val)
-            )
+    def _process_motion(self) -> None:
+        if self._pending_motion is None:
+            return
+        aligned_x, canvas_pos = self._pending_motion
+        self._pending_motion = None
 
+        hover_entries = self._hover_entries(aligned_x)
         if not hover_entries:
             self._hide_cursor()
             self._notify_hover(None)
             return
 
-        aligned_x = float(event.xdata)
         self._cursor_line.set_xdata((aligned_x, aligned_x))
-        if not self._cursor_line.get_visible():
-            self._cursor_line.set_visible(True)
-        self.canvas.draw_idle()
-
-        if event.guiEvent is not None and hasattr(event.guiEvent, "position"):
-            qt_pos = event.guiEvent.position()
-            canvas_pos = (int(qt_pos.x()), int(qt_pos.y()))
-        else:
-            canvas_height = self.canvas.height()
-            canvas_pos = (int(event.x), int(canvas_height - event.y))
+        self._cursor_line.set_visible(True)
+        self._blit_cursor()
 
-        details = HoverDetails(xdata=float(aligned_x), canvas_pos=canvas_pos, entries=hover_entries)
+        details = HoverDetails(xdata=aligned_x, canvas_pos=canvas_pos, entries=hover_entries)
         self._notify_hover(details)
 
+    def _hover_entries(self, xdata: float) -> List[HoverSeriesInfo]:
+        """Point of each series nearest to ``xdata``, by binary search."""
+
+        entries: List[HoverSeriesInfo] = []
+        for snapshot in self._series_snapshots.values():
+            xs = snapshot.xdata
+            if xs.size == 0:
+                continue
+
+            idx = int(np.searchsorted(xs, xdata))
+            if idx == xs.size or (idx > 0 and xdata - xs[idx - 1] <= xs[idx] - xdata):
+                # Ties go to the lower angle; step back to the first of equal angles.
+                idx = int(np.searchsorted(xs, xs[idx - 1]))
+            entries.append(
+                HoverSeriesInfo(
+                    label=snapshot.label,
+                    color=snapshot.color,
+                    x=float(xs[idx]),
+                    y=float(snapshot.ydata[idx]),
+                )
+            )
+        return entries
+
     def _on_mouse_leave(self, _event) -> None:
+        self._pending_motion = None
         self._hide_cursor()
         self._notify_hover(None)
 
     def _hide_cursor(self) -> None:
         if self._cursor_line is not None and self._cursor_line.get_visible():
             self._cursor_line.set_visible(False)
-            self.canvas.draw_idle()
+            self._blit_cursor()
 
     def _notify_hover(self, details: Optional[HoverDetails]) -> None:
         if self._hover_callback is not None:
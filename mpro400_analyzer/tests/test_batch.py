@@ -0,0 +1,73 @@
+import csv
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app import batch
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLE = Path(__file__).resolve().parent / "data" / "sample.csv"
+
+
+def test_batch_writes_summary_rows(tmp_path):
+    for index in range(3):
+        (tmp_path / f"curve_{index}.csv").write_bytes(SAMPLE.read_bytes())
+    (tmp_path / "broken.csv").write_text("Station;\nFoo;Bar", encoding="utf-8")
+    output = tmp_path / "summary.csv"
+
+    code = batch.main(
+        [
+            str(tmp_path),
+            "--reference",
+            "1.5",
+            "--workers",
+            "2",
+            "--spec",
+            "peak_torque::1.5",
+            "-o",
+            str(output),
+        ]
+    )
+    assert code == 0
+
+    with output.open(encoding="utf-8-sig", newline="") as stream:
+        rows = list(csv.DictReader(stream))
+
+    assert [Path(row["file"]).name for row in rows] == [
+        "broken.csv",
+        "curve_0.csv",
+        "curve_1.csv",
+        "curve_2.csv",
+    ]
+    assert rows[0]["error"]
+    assert rows[1]["reference_hit"] == "True"
+    assert float(rows[1]["peak_torque"]) == 2.0
+    assert float(rows[1]["final_angle"]) == 0.0
+    assert rows[1]["spec"] == "NG"
+    assert rows[1]["spec_failures"] == "peak_torque"
+
+
+def test_batch_rejects_reference_rule_without_reference(capsys):
+    with pytest.raises(SystemExit) as exc:
+        batch.main([str(SAMPLE), "--spec", "angle_after_reference:100:200"])
+    assert exc.value.code == 2
+    assert "--reference" in capsys.readouterr().err
+
+
+def test_run_batch_reports_unreadable_paths_in_the_error_column(tmp_path):
+    good = tmp_path / "curve.csv"
+    good.write_bytes(SAMPLE.read_bytes())
+    folder = tmp_path / "folder.csv"
+    folder.mkdir()
+
+    rows = batch.run_batch([folder, good], batch.BatchSettings(), workers=2)
+
+    assert rows[0]["error"] and rows[0]["points"] == ""
+    assert rows[1]["error"] == "" and rows[1]["points"] == 4
+
+
+def test_batch_does_not_import_qt():
+    script = "import sys, app.batch; sys.exit(any(m.startswith('PySide6') for m in sys.modules))"
+    assert subprocess.run([sys.executable, "-c", script], cwd=ROOT).returncode == 0
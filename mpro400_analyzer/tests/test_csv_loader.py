@@ -1,8 +1,10 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from data import csv_loader
 from data.csv_loader import CsvFormatError, load_csv
 
 
@@ -26,3 +28,136 @@ def test_missing_header_raises(tmp_path):
 
     with pytest.raises(CsvFormatError):
         load_csv(broken)
+
+
+def test_c_and_python_engines_agree(tmp_path):
+    export = tmp_path / "cp949.csv"
+    export.write_bytes(
+        "Station;라인1\nTool;01\nAngle;Torque;Window ID\n0,00;0,10;\n1,00;0,50;\n2,00;;9,00\n".encode("cp949")
+    )
+
+    fast = load_csv(export)
+    legacy = load_csv(export, engine="python")
+
+    assert fast.metadata == legacy.metadata
+    assert fast.metadata["Station"] == "라인1"
+    pd.testing.assert_frame_equal(fast.dataframe, legacy.dataframe)
+    assert fast.dataframe["Torque"].tolist() == [0.1, 0.5]
+
+
+def test_encoding_detection_is_cached_per_file_and_directory(tmp_path, monkeypatch):
+    csv_loader.clear_encoding_cache()
+    calls = []
+
+    def fake_detect(sample):
+        calls.append(len(sample))
+        return {"encoding": "cp949"}
+
+    monkeypatch.setattr(csv_loader, "chardet", type("Stub", (), {"detect": staticmethod(fake_detect)}))
+    body = "Station;라인1\nAngle;Torque\n" + "1,00;0,50\n" * 5000
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    first.write_bytes(body.encode("cp949"))
+    second.write_bytes(body.encode("cp949"))
+
+    load_csv(first)
+    load_csv(first)
+    assert len(calls) == 1
+    assert calls[0] < 100  # only the metadata prefix is sampled
+
+    assert load_csv(second).metadata["Station"] == "라인1"
+    assert len(calls) == 1  # directory hint skips detection
+    csv_loader.clear_encoding_cache()
+
+
+def test_iter_curve_chunks_matches_full_load(tmp_path):
+    rows = "".join(f"{i},00;{i % 7},25\n" for i in range(2500))
+    export = tmp_path / "long.csv"
+    export.write_text(
+        "Station;\nTool;01\nAngle;Torque;Window ID\n" + rows + "0,00;;9,00\n300,00;1,00;11,00\n",
+        encoding="utf-8",
+    )
+
+    chunks = list(csv_loader.iter_curve_chunks(export, chunk_rows=1000))
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+    full = load_csv(export).curve
+    angles = full.angle[(full.window_id != full.window_id) | (full.window_id == 0)]
+    assert np.array_equal(np.concatenate([chunk.angle for chunk in chunks]), angles)
+
+
+def test_iter_curve_chunks_rejects_headerless_files_early(tmp_path):
+    summary = tmp_path / "summary.csv"
+    summary.write_text("file,peak_torque\n" + "a.csv,1.0\n" * 400_000, encoding="utf-8")
+    reads = []
+
+    class CountingReader:
+        def __init__(self, handle):
+            self._handle = handle
+
+        def read(self, size=-1):
+            reads.append(size)
+            return self._handle.read(size)
+
+    with summary.open("rb") as handle, pytest.raises(CsvFormatError, match="Not an MPRO400 export"):
+        csv_loader._read_header(CountingReader(handle), summary)
+    assert sum(reads) <= csv_loader.HEADER_LIMIT_BYTES
+
+    with pytest.raises(CsvFormatError):
+        list(csv_loader.iter_curve_chunks(summary))
+
+
+def test_header_falls_back_to_cp949_while_streaming(tmp_path):
+    export = tmp_path / "legacy.csv"
+    export.write_bytes("작업자;홍길동\nAngle;Torque\n1,00;2,00\n".encode("cp949"))
+    csv_loader.clear_encoding_cache()
+    # A wrong cached guess must not make the header unreadable.
+    csv_loader.remember_encoding(export, "utf-8", update_hint=False)
+
+    with export.open("rb") as handle:
+        metadata, _offset, encoding, _prefix = csv_loader._read_header(handle, export)
+
+    assert encoding == "cp949" and metadata["작업자"] == "홍길동"
+    csv_loader.clear_encoding_cache()
+
+
+def test_scan_metadata_reads_headers_only(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    large = tmp_path / "large.csv"
+    large.write_text(
+        "Date;16.09.25\nTool;02\nAngle;Torque\n" + "".join(f"{i},00;1,50\n" for i in range(20000)),
+        encoding="utf-8",
+    )
+    broken = tmp_path / "broken.csv"
+    broken.write_text("Station;\nFoo;Bar", encoding="utf-8")
+
+    scans = csv_loader.scan_metadata([sample, large, broken, tmp_path / "missing.csv"], workers=2)
+
+    assert [scan.path.name for scan in scans] == ["sample.csv", "large.csv", "broken.csv", "missing.csv"]
+    assert scans[0].metadata["Tool"] == "01"
+    assert scans[0].row_estimate == 4
+    assert scans[1].metadata["Tool"] == "02"
+    assert abs(scans[1].row_estimate - 20000) < 1000
+    assert scans[2].error and scans[3].error
+
+
+def test_scan_metadata_rejects_large_non_exports_quickly(tmp_path, monkeypatch):
+    # A batch summary left in the scanned folder: big, and no MPRO400 header.
+    summary = tmp_path / "summary.csv"
+    summary.write_text("file,peak_torque,spec\n" + "a.csv,1.0,OK\n" * 500_000, encoding="utf-8")
+    garbage = tmp_path / "garbage.csv"
+    garbage.write_bytes(bytes(range(128, 256)) * 40_000)
+    decoded = []
+    original = csv_loader._read_metadata_line
+
+    def counting(line, encoding, metadata):
+        decoded.append(len(line))
+        return original(line, encoding, metadata)
+
+    monkeypatch.setattr(csv_loader, "_read_metadata_line", counting)
+    scans = csv_loader.scan_metadata([summary, garbage], workers=1)
+
+    assert "Not an MPRO400 export" in scans[0].error
+    assert scans[1].error
+    # Every line is decoded at most once per encoding tried.
+    assert sum(decoded) <= 2 * csv_loader.HEADER_LIMIT_BYTES
@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from data import csv_loader
+from data.csv_loader import load_csv
+from data.curve_cache import CurveCache
+
+SAMPLE = Path(__file__).resolve().parent / "data" / "sample.csv"
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    cache = CurveCache(tmp_path / "cache")
+    source = tmp_path / "curve.csv"
+    source.write_bytes(SAMPLE.read_bytes())
+
+    parsed = load_csv(source, cache=cache)
+    assert cache.size_bytes() > 0
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("cache hit must not parse")
+
+    monkeypatch.setattr(csv_loader, "_parse_bytes", fail)
+    cached = load_csv(source, cache=cache)
+
+    assert cached.metadata == parsed.metadata
+    pd.testing.assert_frame_equal(cached.dataframe, parsed.dataframe)
+
+
+def test_cache_invalidates_on_change_and_evicts_oldest(tmp_path):
+    cache = CurveCache(tmp_path / "cache")
+    source = tmp_path / "curve.csv"
+    source.write_bytes(SAMPLE.read_bytes())
+    load_csv(source, cache=cache)
+    entry_size = cache.size_bytes()
+
+    source.write_bytes(SAMPLE.read_bytes().replace(b"2,00;30", b"2,50;30"))
+    assert load_csv(source, cache=cache).dataframe["Torque"].iloc[-1] == 2.5
+
+    entries = sorted(cache.directory.glob("*.npz"), key=os.path.getmtime)
+    assert len(entries) == 2
+
+    cache.max_bytes = entry_size + entry_size // 2
+    other = tmp_path / "other.csv"
+    other.write_bytes(SAMPLE.read_bytes())
+    os.utime(entries[0], (0, 0))
+    load_csv(other, cache=cache)
+
+    remaining = set(cache.directory.glob("*.npz"))
+    assert entries[0] not in remaining
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_store_lists_directory_only_when_eviction_is_due(tmp_path, monkeypatch):
+    cache = CurveCache(tmp_path / "cache")
+    listings = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: listings.append(1) or entries())
+
+    for index in range(30):
+        source = tmp_path / f"curve_{index}.csv"
+        source.write_bytes(SAMPLE.read_bytes())
+        load_csv(source, cache=cache)
+
+    assert len(listings) == 1  # the initial measurement
+    assert cache._total == sum(entry.stat().st_size for entry in cache.directory.glob("*.npz"))
+
+    cache.max_bytes = cache._total // 2
+    source = tmp_path / "curve_last.csv"
+    source.write_bytes(SAMPLE.read_bytes())
+    load_csv(source, cache=cache)
+    assert cache.size_bytes() <= cache.max_bytes
+    assert cache._total == cache.size_bytes()
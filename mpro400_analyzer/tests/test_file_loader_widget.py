@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from data.csv_loader import CsvData
+from data.curve import Curve
+from data.data_manager import DataManager
+from ui.file_loader_widget import FileLoaderWidget
+
+
+def _ensure_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_file_list_builds_row_widgets_lazily():
+    app = _ensure_app()
+    manager = DataManager()
+    angle = np.linspace(0.0, 90.0, 50)
+    for index in range(300):
+        manager.add_csv(CsvData(Path(f"tightening_{index}.csv"), {}, Curve(angle, angle / 10.0)))
+
+    widget = FileLoaderWidget()
+    widget.resize(400, 500)
+    widget.show()
+    widget.set_datasets(manager.datasets(), None)
+    app.processEvents()
+
+    list_widget = widget.list_widget
+    assert list_widget.count() == 300
+    built = [row for row in range(300) if list_widget.itemWidget(list_widget.item(row)) is not None]
+    assert built and built[0] == 0
+    assert len(built) < 300
+
+    selected = []
+    widget.datasetSelected.connect(selected.append)
+    list_widget.item(299).setSelected(True)
+    assert selected == [manager.datasets()[299].identifier]
+
+    list_widget.scrollToBottom()
+    app.processEvents()
+    assert list_widget.itemWidget(list_widget.item(299)) is not None
+    widget.close()
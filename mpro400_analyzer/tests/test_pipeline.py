@@ -1,6 +1,12 @@
-﻿from pathlib import Path
+﻿from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from data.data_manager import DataManager
+import numpy as np
+import pandas as pd
+
+from data.csv_loader import CsvData, load_csv
+from data.curve import Curve
+from data.data_manager import CHANGE_STYLE, CHANGE_VISIBILITY, DataManager
 
 
 def test_manager_loads_and_corrects_angles():
@@ -16,6 +22,11 @@ def test_manager_loads_and_corrects_angles():
     payload = payloads[0]
     assert payload.label == sample.name
     assert payload.x[0] == 0.0
+    assert payload.x.dtype == np.float64 and payload.y.dtype == np.float64
+    # Unfiltered payloads are read-only views of the cached segment.
+    segment = manager.datasets()[0].segment
+    assert np.shares_memory(payload.y, segment.torque)
+    assert not payload.y.flags.writeable
 
     manager.update_reference(1.5)
     payload = manager.plot_payloads()[0]
@@ -35,3 +46,297 @@ def test_manager_loads_and_corrects_angles():
     manager.load([sample])
     manager.clear()
     assert manager.datasets() == []
+
+
+def test_parallel_load_keeps_order_colors_and_warnings(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    paths = []
+    for index in range(6):
+        target = tmp_path / f"curve_{index}.csv"
+        target.write_bytes(sample.read_bytes())
+        paths.append(target)
+    broken = tmp_path / "broken.csv"
+    broken.write_text("Station;\nFoo;Bar", encoding="utf-8")
+    paths.insert(2, broken)
+
+    serial = DataManager()
+    serial_warnings = serial.load(paths, workers=1)
+
+    manager = DataManager()
+    warnings = manager.load(paths, workers=3)
+
+    assert warnings == serial_warnings
+    assert len(warnings) == 1 and warnings[0].startswith("broken.csv")
+    assert [d.name for d in manager.datasets()] == [d.name for d in serial.datasets()]
+    assert [d.color for d in manager.datasets()] == [d.color for d in serial.datasets()]
+
+
+def test_loads_share_one_thread_pool(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    paths = []
+    for index in range(5):
+        target = tmp_path / f"curve_{index}.csv"
+        target.write_bytes(sample.read_bytes())
+        paths.append(target)
+
+    manager = DataManager()
+    manager.load(paths, workers=2)
+    pool = manager._pool
+    assert isinstance(pool, ThreadPoolExecutor)
+
+    manager.load(paths, append=True, workers=2)
+    assert manager._pool is pool
+    assert len(manager.datasets()) == 10
+
+    manager.shutdown()
+    assert manager._pool is None
+
+
+def test_load_reports_unreadable_files_as_warnings(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    good = tmp_path / "good.csv"
+    good.write_bytes(sample.read_bytes())
+    garbage = tmp_path / "garbage.csv"
+    garbage.write_bytes(bytes(range(128, 256)) * 64)
+    folder = tmp_path / "folder.csv"
+    folder.mkdir()
+
+    manager = DataManager()
+    warnings = manager.load([garbage, folder, good], workers=1)
+
+    assert [d.name for d in manager.datasets()] == ["good.csv"]
+    assert [w.split(":")[0] for w in warnings] == ["garbage.csv", "folder.csv"]
+
+
+def test_limits_by_count_and_memory(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    paths = []
+    for index in range(5):
+        target = tmp_path / f"tightening_{index}.csv"
+        target.write_bytes(sample.read_bytes())
+        paths.append(target)
+
+    manager = DataManager(max_files=3)
+    warnings = manager.load(paths, workers=1)
+    assert warnings == ["파일은 최대 3개까지만 불러올 수 있습니다."]
+    assert [d.name for d in manager.datasets()] == ["tightening_0.csv", "tightening_1.csv", "tightening_2.csv"]
+    assert manager.dataset_for_path(paths[1]).name == "tightening_1.csv"
+    assert manager.dataset_for_path(paths[4]) is None
+
+    used = manager.memory_in_use
+    manager.remove(manager.datasets()[1].identifier)
+    assert manager.dataset_for_path(paths[1]) is None
+    assert manager.memory_in_use < used
+    manager.clear()
+    assert manager.memory_in_use == 0
+
+    manager = DataManager()
+    manager.max_memory_bytes = 1
+    warnings = manager.load(paths, workers=1)
+    assert len(manager.datasets()) == 1
+    assert warnings and "메모리" in warnings[0]
+
+
+def test_float32_storage_keeps_payloads():
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    compact = DataManager(storage_dtype=np.float32)
+    compact.load([sample])
+
+    curve = compact.datasets()[0].curve
+    assert curve.angle.dtype == np.float32
+    assert curve.angle.flags["C_CONTIGUOUS"]
+
+    reference = DataManager()
+    reference.load([sample])
+    np.testing.assert_allclose(compact.plot_payloads()[0].y, reference.plot_payloads()[0].y, rtol=1e-6)
+
+
+def test_ingest_replaces_known_files_and_rolls_off_oldest(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    manager = DataManager()
+    manager.rolling_limit = 2
+
+    paths = []
+    for index in range(3):
+        target = tmp_path / f"tightening_{index}.csv"
+        target.write_bytes(sample.read_bytes())
+        paths.append(target)
+
+    first, removed = manager.ingest(load_csv(paths[0]))
+    assert removed == []
+    manager.ingest(load_csv(paths[1]))
+    _, removed = manager.ingest(load_csv(paths[2]))
+
+    assert removed == [first.identifier]
+    assert [d.name for d in manager.datasets()] == ["tightening_1.csv", "tightening_2.csv"]
+
+    paths[2].write_bytes(sample.read_bytes().replace(b"3,00;2,00;30", b"3,00;2,50;30"))
+    refreshed, removed = manager.ingest(load_csv(paths[2]))
+    assert removed == []
+    assert len(manager.datasets()) == 2
+    assert refreshed.curve.torque[-1] == 2.5
+
+
+def test_path_index_survives_removing_a_duplicate(tmp_path):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    target = tmp_path / "tightening.csv"
+    target.write_bytes(sample.read_bytes())
+    manager = DataManager()
+
+    older = manager.add_csv(load_csv(target))
+    newer = manager.add_csv(load_csv(target))
+    assert manager.dataset_for_path(target) is newer
+
+    manager.remove(newer.identifier)
+    assert manager.dataset_for_path(target) is older
+
+    refreshed, removed = manager.ingest(load_csv(target))
+    assert refreshed is older and removed == []
+    assert len(manager.datasets()) == 1
+
+    manager.remove(older.identifier)
+    assert manager.dataset_for_path(target) is None
+
+
+def test_primary_segment_is_computed_once_per_data(monkeypatch):
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    manager = DataManager()
+    manager.load([sample])
+
+    calls = []
+    original = manager._strip_reference_rows
+    monkeypatch.setattr(manager, "_strip_reference_rows", lambda curve: calls.append(1) or original(curve))
+
+    for value in (0.0, 0.5, 1.5):
+        manager.update_reference(value)
+        manager.update_ranges((0.0, 5.0), (None, None))
+        manager.plot_payloads()
+    assert calls == []
+
+    dataset = manager.datasets()[0]
+    dataset.replace_csv(load_csv(sample))
+    manager.plot_payloads()
+    manager.plot_payloads()
+    assert calls == [1]
+
+
+def test_take_changes_reports_only_what_changed():
+    sample = Path(__file__).resolve().parent / "data" / "sample.csv"
+    manager = DataManager()
+    manager.load([sample, sample])
+    first, second = (d.identifier for d in manager.datasets())
+    assert manager.take_changes().full
+    assert not manager.take_changes()
+
+    manager.set_color(first, "#123456")
+    manager.set_enabled(second, False)
+    manager.set_enabled(first, False)
+    changes = manager.take_changes()
+    assert not changes.full
+    assert changes.datasets == {first: CHANGE_VISIBILITY, second: CHANGE_VISIBILITY}
+
+    manager.set_line_style(second, "dash")
+    assert manager.take_changes().datasets == {second: CHANGE_STYLE}
+    assert manager.payload_for(second) is None
+
+    manager.update_ranges((None, None), (None, None))
+    manager.update_reference(0.0)
+    assert not manager.take_changes()
+    manager.update_reference(1.0)
+    assert manager.take_changes().full
+
+
+def test_reference_alignment_matches_linear_scan():
+    rng = np.random.default_rng(3)
+    manager = DataManager()
+    for _ in range(100):
+        size = int(rng.integers(1, 300))
+        torque = rng.normal(2.0, 1.5, size=size)
+        torque[rng.random(size) < 0.1] = np.nan
+        dataset = manager.add_csv(CsvData(Path("x.csv"), {}, Curve(np.arange(size, dtype=float), torque)))
+        manager._primary_segment(dataset)
+        for reference in (0.5, 2.0, 4.0, 9.0):
+            manager.update_reference(reference)
+            offset, hit = manager._reference_offset(dataset.segment, dataset.running_peak)
+            hits = np.flatnonzero(torque >= reference)
+            assert hit == (hits.size > 0)
+            if hit:
+                assert offset == hits[0]
+        manager.clear()
+
+
+def test_angle_window_matches_full_mask():
+    rng = np.random.default_rng(11)
+    manager = DataManager()
+    for trial in range(100):
+        size = int(rng.integers(1, 300))
+        angle = np.cumsum(rng.uniform(0.01, 1.0, size=size)) - 20.0
+        torque = rng.normal(2.0, 1.5, size=size)
+        if trial % 4 == 0:
+            angle[rng.integers(size)] = np.nan  # falls back to full masks
+        manager.add_csv(CsvData(Path("x.csv"), {}, Curve(angle, torque)))
+        for reference in (0.0, 2.5):
+            for amin, amax in ((None, None), (-5.0, 30.0), (None, 0.0), (7.3, None), (50.0, -50.0)):
+                manager.update_reference(reference)
+                manager.update_ranges((1.0, None), (amin, amax))
+                dataset = manager.datasets()[0]
+                payload = manager.plot_payloads()[0]
+
+                segment = dataset.segment
+                offset, _ = manager._reference_offset(segment, dataset.running_peak)
+                angles = segment.angle - offset if offset else segment.angle
+                mask = segment.torque >= 1.0
+                if amin is not None:
+                    mask &= angles >= amin
+                if amax is not None:
+                    mask &= angles <= amax
+                np.testing.assert_array_equal(payload.x, angles[mask])
+                np.testing.assert_array_equal(payload.y, segment.torque[mask])
+        manager.clear()
+
+
+def _reference_primary_segment(df: pd.DataFrame) -> pd.DataFrame:
+    """Segment selection as originally written with per-segment DataFrame copies."""
+
+    angle_values = pd.to_numeric(df["Angle"], errors="coerce").to_numpy()
+    decreases = np.where(np.diff(angle_values) <= 0)[0] + 1
+    if decreases.size == 0:
+        return df
+
+    segments = []
+    start = 0
+    for stop in decreases:
+        segment = df.iloc[start:stop].copy()
+        if not segment.empty:
+            segments.append(segment)
+        start = int(stop)
+    tail = df.iloc[start:].copy()
+    if not tail.empty:
+        segments.append(tail)
+
+    def segment_score(segment: pd.DataFrame) -> tuple:
+        torque = pd.to_numeric(segment["Torque"], errors="coerce")
+        if torque.isna().all():
+            return (0.0, len(segment))
+        return (float(torque.max() - torque.min()), len(segment))
+
+    return max(segments, key=segment_score)
+
+
+def test_vectorized_primary_segment_matches_reference():
+    rng = np.random.default_rng(7)
+    manager = DataManager()
+    for trial in range(200):
+        size = int(rng.integers(1, 400))
+        angle = np.cumsum(rng.choice([-1.0, 0.0, 1.0, 2.0], size=size, p=[0.15, 0.05, 0.5, 0.3]))
+        torque = np.round(rng.normal(2.0, 1.0, size=size), 1)
+        torque[rng.random(size) < 0.05] = np.nan
+        if trial % 10 == 0:
+            torque[:] = 1.0  # every segment ties on span
+        df = pd.DataFrame({"Angle": angle, "Torque": torque})
+
+        expected = _reference_primary_segment(df)
+        selected = manager._select_primary_angle_segment(Curve.from_dataframe(df))
+
+        np.testing.assert_array_equal(selected.angle, expected["Angle"].to_numpy())
+        np.testing.assert_array_equal(selected.torque, expected["Torque"].to_numpy())
@@ -1,8 +1,14 @@
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
+import pytest
 from PySide6.QtWidgets import QApplication
 
 from data.data_manager import PlotPayload
+from data.envelope import compute_envelope
+from data.resample import ResampledCurves
+from plots.decimate import minmax_decimate
 from plots.plotter import Plotter
 
 
@@ -32,3 +38,248 @@ def test_plotter_draws_lines(tmp_path):
     target = tmp_path / "out.png"
     plotter.save(str(target), dpi=100)
     assert target.exists()
+
+
+def test_plotter_updates_series_in_place():
+    _ensure_app()
+    plotter = Plotter()
+
+    payloads = [
+        PlotPayload(
+            label=f"파일 {index}",
+            x=[0.0, 1.0, 2.0],
+            y=[0.0, float(index), 2.0 * index],
+            color="#4aa8ff",
+            line_style="solid",
+            reference_hit=True,
+            identifier=index,
+        )
+        for index in (1, 2)
+    ]
+    plotter.draw(payloads)
+    line = plotter._lines[2]
+
+    plotter.restyle_series(2, "#ff0000", "dash")
+    assert plotter._lines[2] is line
+    assert line.get_color() == "#ff0000"
+
+    plotter.hide_series(2)
+    assert not line.get_visible()
+    assert plotter.axes.get_ylim()[1] < 4.0
+    assert [t.get_text() for t in plotter.axes.get_legend().get_texts()] == ["파일 1"]
+
+    plotter.update_series(payloads[1])
+    assert line.get_visible() and plotter._lines[2] is line
+    assert plotter.axes.get_ylim()[1] >= 4.0
+
+
+def test_plotter_draws_envelope_with_constant_artists():
+    _ensure_app()
+    plotter = Plotter()
+    grid = np.linspace(0.0, 90.0, 64)
+    torque = np.vstack([grid / 10.0 + offset for offset in np.linspace(-0.5, 0.5, 300)])
+    envelope = compute_envelope(ResampledCurves(grid=grid, identifiers=list(range(300)), torque=torque))
+
+    plotter.draw_envelope(envelope)
+    assert len(plotter._lines) == 1
+    assert len(plotter.axes.collections) == 1
+    np.testing.assert_allclose(plotter._lines[-1].get_ydata(), grid / 10.0, atol=1e-12)
+
+
+def test_minmax_decimation_keeps_column_extremes():
+    rng = np.random.default_rng(2)
+    x = np.linspace(0.0, 100.0, 200_000)
+    y = rng.normal(size=x.size)
+    y[123_456] = 50.0
+    y[7] = np.nan
+
+    xs, ys = minmax_decimate(x, y, 0.0, 100.0, 500)
+
+    assert xs.size <= 4 * 500 + 2
+    assert np.all(np.diff(xs) >= 0)
+    assert np.nanmax(ys) == 50.0 and np.nanmin(ys) == np.nanmin(y)
+    assert np.isnan(ys).sum() == 1
+    columns = np.clip((x / 100.0 * 500).astype(int), 0, 499)
+    kept = np.clip((xs / 100.0 * 500).astype(int), 0, 499)
+    for column in (0, 250, 499):
+        assert np.nanmax(ys[kept == column]) == np.nanmax(y[columns == column])
+        assert np.nanmin(ys[kept == column]) == np.nanmin(y[columns == column])
+
+
+def test_plotter_redecimates_on_zoom(tmp_path):
+    _ensure_app()
+    plotter = Plotter()
+    x = np.linspace(0.0, 1000.0, 100_000)
+    payload = PlotPayload(
+        label="dense",
+        x=x,
+        y=np.sin(x),
+        color="#4aa8ff",
+        line_style="solid",
+        reference_hit=True,
+        identifier=1,
+    )
+    plotter.draw([payload])
+    line = plotter._lines[1]
+    assert len(line.get_xdata()) < 5000
+
+    plotter.axes.set_xlim(100.0, 110.0)
+    zoomed = np.asarray(line.get_xdata())
+    assert zoomed[0] < 100.0 and zoomed[-1] > 110.0
+    assert len(zoomed) == np.count_nonzero((x >= 100.0) & (x <= 110.0)) + 2
+
+    plotter.save(str(tmp_path / "full.png"), dpi=100)
+    assert len(line.get_xdata()) == len(zoomed)
+
+
+def test_plotter_redraw_reuses_lines(monkeypatch):
+    _ensure_app()
+    plotter = Plotter()
+
+    def payload(identifier, scale=1.0):
+        return PlotPayload(
+            label=f"파일 {identifier}",
+            x=np.array([0.0, 1.0, 2.0]),
+            y=np.array([0.0, 1.0, 2.0]) * scale,
+            color="#4aa8ff",
+            line_style="solid",
+            reference_hit=True,
+            identifier=identifier,
+        )
+
+    plotter.draw([payload(1), payload(2), payload(3)])
+    first, third = plotter._lines[1], plotter._lines[3]
+    layouts = []
+    monkeypatch.setattr(plotter.figure, "tight_layout", lambda: layouts.append(1))
+
+    plotter.draw([payload(1, 1.5), payload(3), payload(4)])
+    assert plotter._lines[1] is first and plotter._lines[3] is third
+    assert list(plotter._lines) == [1, 3, 4]
+    assert plotter.axes.lines[1:] == [first, third, plotter._lines[4]]
+    assert plotter.axes.get_ylim()[1] >= 3.0
+    assert [t.get_text() for t in plotter.axes.get_legend().get_texts()] == ["파일 1", "파일 3", "파일 4"]
+    # Same labels, canvas size and tick label widths: no new layout pass.
+    count = len(layouts)
+    plotter.draw([payload(1, 1.5), payload(3), payload(4, 0.5)])
+    assert len(layouts) == count
+
+    plotter.draw([payload(4), payload(1)])
+    assert plotter._lines[1] is not first
+
+
+def test_plotter_blits_cursor_without_full_redraw(monkeypatch):
+    _ensure_app()
+    plotter = Plotter()
+    x = np.linspace(0.0, 90.0, 500)
+    plotter.draw(
+        [PlotPayload("곡선", x, x / 10.0, "#4aa8ff", "solid", True, identifier=1)]
+    )
+    plotter.canvas.draw()
+    assert plotter._background is not None
+
+    redraws = []
+    monkeypatch.setattr(plotter.canvas, "draw_idle", lambda: redraws.append(1))
+    event = SimpleNamespace(inaxes=plotter.axes, xdata=45.0, x=100, y=100, guiEvent=None)
+    plotter._on_mouse_move(event)
+    plotter._process_motion()
+    assert plotter._cursor_line.get_visible()
+    assert plotter._cursor_line.get_animated()
+    plotter._on_mouse_leave(None)
+    assert not plotter._cursor_line.get_visible()
+    assert redraws == []
+
+    plotter.axes.set_xlim(10.0, 20.0)
+    assert plotter._background is None
+    plotter._on_mouse_move(event)
+    plotter._process_motion()
+    assert redraws == [1]
+
+
+def test_plotter_hover_lookup_matches_nearest_point():
+    _ensure_app()
+    plotter = Plotter()
+    rng = np.random.default_rng(4)
+    x = np.round(rng.uniform(0.0, 50.0, size=400), 1)  # unsorted, with repeats
+    y = rng.normal(size=x.size)
+    y[3] = np.nan
+    plotter.draw([PlotPayload("곡선", x, y, "#4aa8ff", "solid", True, identifier=1)])
+    finite = np.isfinite(y)
+
+    for query in np.append(rng.uniform(-5.0, 55.0, size=200), x[:20]):
+        entry, = plotter._hover_entries(float(query))
+        idx = int(np.argmin(np.abs(x[finite] - query)))
+        assert abs(entry.x - query) == abs(x[finite][idx] - query)
+        assert entry.y in y[finite][x[finite] == entry.x]
+
+
+def test_plotter_coalesces_mouse_moves():
+    app = _ensure_app()
+    plotter = Plotter()
+    x = np.linspace(0.0, 90.0, 91)
+    plotter.draw([PlotPayload("곡선", x, x, "#4aa8ff", "solid", True, identifier=1)])
+    seen = []
+    plotter.set_hover_callback(seen.append)
+
+    for xdata in (10.0, 20.0, 30.0):
+        plotter._on_mouse_move(
+            SimpleNamespace(inaxes=plotter.axes, xdata=xdata, x=0, y=0, guiEvent=None)
+        )
+    assert seen == []
+    plotter._motion_timer.timeout.emit()
+    app.processEvents()
+
+    assert [details.xdata for details in seen if details is not None] == [30.0]
+
+
+def test_plotter_places_legend_without_rendering(monkeypatch):
+    _ensure_app()
+    plotter = Plotter()
+    plotter.canvas.resize(800, 500)
+    monkeypatch.setattr(plotter.canvas, "draw", lambda: pytest.fail("synchronous draw"))
+    x = np.linspace(0.0, 90.0, 2000)
+    # Falls from the top left corner: the upper left legend would cover it.
+    plotter.draw([PlotPayload("하강", x, 10.0 - x / 9.0, "#4aa8ff", "solid", True, identifier=1)])
+    assert plotter._legend_loc == "upper right"
+
+    plotter.set_legend_outside(True)
+    legend_box = plotter.axes.get_legend().get_window_extent(plotter.canvas.get_renderer())
+    assert legend_box.x0 > plotter.axes.bbox.x1
+
+
+def test_outside_legend_gets_room_after_incremental_updates():
+    _ensure_app()
+    plotter = Plotter()
+    plotter.canvas.resize(600, 400)
+    plotter.set_legend_outside(True)
+    x = np.array([0.0, 1.0, 2.0])
+    payloads = [
+        PlotPayload(f"tightening_{index:04d}.csv", x, x * index, "#4aa8ff", "solid", True, index)
+        for index in range(1, 22)
+    ]
+    plotter.draw(payloads)
+    assert plotter.axes.get_legend() is None  # over the entry cap
+
+    plotter.hide_series(21)
+    renderer = plotter.canvas.get_renderer()
+    legend_box = plotter.axes.get_legend().get_window_extent(renderer)
+    assert legend_box.x0 > plotter.axes.bbox.x1
+    assert legend_box.x1 <= plotter.figure.bbox.x1
+
+    long_label = "a much longer file name for this tightening.csv"
+    plotter.update_series(PlotPayload(long_label, x, x, "#4aa8ff", "solid", True, identifier=1))
+    legend_box = plotter.axes.get_legend().get_window_extent(renderer)
+    assert legend_box.x1 <= plotter.figure.bbox.x1
+
+
+def test_legend_probe_points_are_bounded_per_series():
+    _ensure_app()
+    plotter = Plotter()
+    plotter.canvas.resize(800, 500)
+    x = np.linspace(0.0, 90.0, 200_000)
+    y = np.sin(x)
+    y[::7] = np.nan
+    plotter.draw([PlotPayload("곡선", x, y, "#4aa8ff", "solid", True, identifier=1)])
+
+    points = plotter._legend_probe_points()
+    assert 0 < len(points) <= 4 * 77
+    assert np.isfinite(points).all()
@@ -0,0 +1,105 @@
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data.csv_loader import CsvData
+from data.curve import Curve
+from data.data_manager import DataManager
+from data.envelope import compute_envelope, nan_quantiles
+from data.resample import AngleGrid, ResampledCurves, resample_curves
+
+
+def test_batched_resampling_matches_per_curve_interp():
+    rng = np.random.default_rng(5)
+    curves = []
+    for identifier in range(40):
+        size = int(rng.integers(2, 200))
+        angles = np.cumsum(rng.uniform(0.05, 2.0, size=size)) + rng.uniform(-60.0, 20.0)
+        curves.append((identifier, angles, rng.normal(2.0, 1.0, size=size)))
+    curves.append((99, np.array([]), np.array([])))
+
+    grid = np.linspace(-70.0, 250.0, 333)
+    result = resample_curves(curves, grid)
+
+    assert result.torque.shape == (41, 333)
+    assert result.identifiers[-1] == 99
+    assert np.isnan(result.torque[-1]).all()
+    for row, (_, angles, torque) in enumerate(curves[:-1]):
+        expected = np.interp(grid, angles, torque, left=np.nan, right=np.nan)
+        np.testing.assert_allclose(result.torque[row], expected, rtol=1e-9, atol=1e-9)
+
+
+def test_manager_resample_is_cached_per_reference_and_grid():
+    manager = DataManager()
+    angle = np.linspace(0.0, 90.0, 91)
+    first = manager.add_csv(CsvData(Path("a.csv"), {}, Curve(angle, angle / 10.0)))
+    manager.add_csv(CsvData(Path("b.csv"), {}, Curve(angle + 5.0, angle / 20.0)))
+
+    grid = manager.angle_grid(64)
+    assert (grid.start, grid.stop) == (0.0, 95.0)
+    resampled = manager.resample(grid)
+    assert resampled.torque.shape == (2, 64)
+    assert manager.resample(grid) is resampled
+
+    manager.update_reference(2.0)
+    aligned = manager.resample(grid)
+    assert aligned is not resampled
+    # Curve a reaches 2 N-m at 20 deg, so that angle becomes 0 deg.
+    assert aligned.torque[0, 0] == 2.0
+
+    manager.set_enabled(first.identifier, False)
+    assert len(manager.resample(grid)) == 1
+    manager.set_enabled(first.identifier, True)
+
+    # Curve b peaks at 4.5 N-m; with a 5 N-m reference it has no alignment point.
+    manager.update_reference(5.0)
+    assert [identifier for identifier, _, _ in manager.aligned_curves()] == [first.identifier]
+    assert manager.resample(manager.angle_grid(64)).identifiers == [first.identifier]
+
+
+def test_nan_quantiles_match_numpy():
+    rng = np.random.default_rng(8)
+    values = rng.normal(size=(57, 40))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[:, 0] = np.nan
+
+    result = nan_quantiles(values, (0.05, 0.5, 0.95))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN column
+        expected = np.nanpercentile(values, [5, 50, 95], axis=0)
+    np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+
+def test_envelope_flags_curves_far_from_the_mean():
+    rng = np.random.default_rng(9)
+    grid = np.linspace(0.0, 10.0, 50)
+    torque = rng.normal(1.0, 0.1, size=(30, 50))
+    torque[7] += 2.0
+    resampled = ResampledCurves(grid=grid, identifiers=list(range(100, 130)), torque=torque)
+
+    envelope = compute_envelope(resampled)
+
+    assert envelope.curves == 30
+    assert envelope.outliers == [107]
+    assert (envelope.count == 30).all()
+    assert (envelope.p5 <= envelope.median).all() and (envelope.median <= envelope.p95).all()
+
+
+def test_angle_grid_matches_aligned_span_without_copying(monkeypatch):
+    manager = DataManager(storage_dtype=np.float32)
+    angle = np.linspace(-10.0, 80.0, 91)
+    manager.add_csv(CsvData(Path("a.csv"), {}, Curve(angle, angle / 10.0)))
+    gappy = angle + 7.5
+    gappy[[0, 40]] = np.nan
+    manager.add_csv(CsvData(Path("b.csv"), {}, Curve(gappy, angle / 12.0)))
+
+    for reference in (0.0, 3.0):
+        manager.update_reference(reference)
+        expected = AngleGrid.spanning(manager.aligned_curves(), 64)
+        monkeypatch.setattr(manager, "aligned_curves", lambda: pytest.fail("copied curves"))
+        assert manager.angle_grid(64) == expected
+        assert manager.angle_grid(64) == expected
+        monkeypatch.undo()
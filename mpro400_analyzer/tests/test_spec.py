@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from data.csv_loader import CsvData
+from data.curve import Curve
+from data.data_manager import DataManager
+from data.spec import SpecFeatures, SpecRule, evaluate_rules
+
+
+def test_rules_evaluate_column_wise():
+    features = SpecFeatures.from_rows(
+        [
+            (10.0, 10.2, 3400.0, 90.0),
+            (8.0, 10.1, 3200.0, np.nan),
+            (np.nan, 12.5, 3500.0, 40.0),
+        ]
+    )
+    rules = [
+        SpecRule("final_torque", 9.5, 10.5),
+        SpecRule("peak_torque", high=12.0),
+        SpecRule.parse("angle_after_reference:30:"),
+    ]
+
+    table = evaluate_rules(rules, features)
+
+    assert table.tolist() == [
+        [True, True, True],
+        [False, True, False],
+        [False, False, True],
+    ]
+    with pytest.raises(ValueError):
+        SpecRule("final_torque")
+    with pytest.raises(ValueError):
+        SpecRule.parse("bogus:1:2")
+
+
+def test_manager_caches_verdicts_per_dataset(monkeypatch):
+    manager = DataManager()
+    angle = np.linspace(0.0, 100.0, 101)
+    good = manager.add_csv(CsvData(Path("good.csv"), {}, Curve(angle, angle / 10.0)))
+    weak = manager.add_csv(CsvData(Path("weak.csv"), {}, Curve(angle, angle / 20.0)))
+    manager.set_spec_rules([SpecRule("peak_torque", 9.0, 11.0), SpecRule("angle_after_reference", 10.0, None)])
+
+    calls = []
+    original = manager._spec_row
+    monkeypatch.setattr(manager, "_spec_row", lambda dataset: calls.append(dataset.identifier) or original(dataset))
+
+    # Without a reference torque the angle rule cannot be checked, so it fails.
+    verdicts = manager.evaluate_specs()
+    assert not verdicts[good.identifier].passed
+    assert verdicts[good.identifier].unchecked == ("angle_after_reference",)
+    assert verdicts[good.identifier].summary() == "Spec NG: Angle after reference (not checked)"
+    assert verdicts[weak.identifier].failures == ("peak_torque", "angle_after_reference")
+
+    manager.evaluate_specs()
+    assert len(calls) == 2
+
+    late = manager.add_csv(CsvData(Path("late.csv"), {}, Curve(angle, angle / 10.0)))
+    manager.evaluate_specs()
+    assert calls[2:] == [late.identifier]
+
+    manager.update_reference(9.5)
+    verdicts = manager.evaluate_specs()
+    assert len(calls) == 6
+    assert verdicts[good.identifier].failures == ("angle_after_reference",)
+    assert verdicts[good.identifier].unchecked == ()
+    assert verdicts[weak.identifier].failures == ("peak_torque", "angle_after_reference")
+    assert good.verdict is verdicts[good.identifier]
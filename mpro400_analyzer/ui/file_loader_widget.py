@@ -2,7 +2,7 @@
 
 from typing import Dict, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QPoint, QSize, Qt, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -55,23 +55,30 @@ class FileLoaderWidget(QWidget):
         layout.addWidget(self.list_widget, stretch=1)
 
         self._items: Dict[int, QListWidgetItem] = {}
+        self._datasets: Dict[int, DataSet] = {}
+        self._row_hint: Optional[QSize] = None
+
+        # Row widgets are only built for rows scrolled into view, so lists of
+        # hundreds of files open instantly.
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.setInterval(0)
+        self._materialize_timer.timeout.connect(self._materialize_visible)
+        scrollbar = self.list_widget.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._schedule_materialize)
+        scrollbar.rangeChanged.connect(self._schedule_materialize)
 
     def set_datasets(self, datasets: list[DataSet], selected_id: Optional[int]) -> None:
         self.list_widget.blockSignals(True)
+        self.list_widget.setUpdatesEnabled(False)
         self.list_widget.clear()
         self._items.clear()
+        self._datasets.clear()
 
         for dataset in datasets:
-            item = QListWidgetItem()
-            widget = _FileItemWidget(dataset)
-            widget.toggled.connect(lambda checked, ident=dataset.identifier: self.datasetToggled.emit(ident, checked))
-            widget.colorChanged.connect(lambda color, ident=dataset.identifier: self.datasetColorChanged.emit(ident, color))
-            widget.styleChanged.connect(lambda style, ident=dataset.identifier: self.datasetStyleChanged.emit(ident, style))
-            item.setSizeHint(widget.sizeHint())
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
-            self._items[dataset.identifier] = item
+            self._append_item(dataset)
 
+        self.list_widget.setUpdatesEnabled(True)
         self.list_widget.blockSignals(False)
 
         if selected_id is not None and selected_id in self._items:
@@ -80,10 +87,71 @@ class FileLoaderWidget(QWidget):
         elif self.list_widget.count():
             self.list_widget.item(0).setSelected(True)
 
+    def add_dataset(self, dataset: DataSet, select: bool = True) -> None:
+        if dataset.identifier in self._items:
+            self.update_dataset(dataset)
+            return
+        self.list_widget.blockSignals(True)
+        item = self._append_item(dataset)
+        self.list_widget.blockSignals(False)
+        if select:
+            self.list_widget.clearSelection()
+            item.setSelected(True)
+
+    def _append_item(self, dataset: DataSet) -> QListWidgetItem:
+        if self._row_hint is None:
+            self._row_hint = _FileItemWidget(dataset).sizeHint()
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, dataset.identifier)
+        item.setSizeHint(self._row_hint)
+        self.list_widget.addItem(item)
+        self._items[dataset.identifier] = item
+        self._datasets[dataset.identifier] = dataset
+        self._materialize_timer.start()
+        return item
+
+    def _create_item_widget(self, item: QListWidgetItem, dataset: DataSet) -> None:
+        widget = _FileItemWidget(dataset)
+        widget.toggled.connect(lambda checked, ident=dataset.identifier: self.datasetToggled.emit(ident, checked))
+        widget.colorChanged.connect(lambda color, ident=dataset.identifier: self.datasetColorChanged.emit(ident, color))
+        widget.styleChanged.connect(lambda style, ident=dataset.identifier: self.datasetStyleChanged.emit(ident, style))
+        item.setSizeHint(widget.sizeHint())
+        self.list_widget.setItemWidget(item, widget)
+
+    def _schedule_materialize(self, *_args) -> None:
+        self._materialize_timer.start()
+
+    def _materialize_visible(self) -> None:
+        count = self.list_widget.count()
+        if not count:
+            return
+        viewport = self.list_widget.viewport()
+        first = self.list_widget.indexAt(QPoint(0, 0)).row()
+        last = self.list_widget.indexAt(QPoint(0, viewport.height() - 1)).row()
+        first = max(first, 0)
+        last = count - 1 if last < 0 else last
+        for row in range(first, min(last + 1, count)):
+            item = self.list_widget.item(row)
+            if self.list_widget.itemWidget(item) is not None:
+                continue
+            dataset = self._datasets.get(item.data(Qt.UserRole))
+            if dataset is not None:
+                self._create_item_widget(item, dataset)
+
+    def remove_dataset(self, identifier: int) -> None:
+        item = self._items.pop(identifier, None)
+        self._datasets.pop(identifier, None)
+        if item is None:
+            return
+        self.list_widget.blockSignals(True)
+        self.list_widget.takeItem(self.list_widget.row(item))
+        self.list_widget.blockSignals(False)
+
     def update_dataset(self, dataset: DataSet) -> None:
         item = self._items.get(dataset.identifier)
         if not item:
             return
+        self._datasets[dataset.identifier] = dataset
         widget = self.list_widget.itemWidget(item)
         if isinstance(widget, _FileItemWidget):
             widget.refresh(dataset)
@@ -92,11 +160,9 @@ class FileLoaderWidget(QWidget):
         selected_items = self.list_widget.selectedItems()
         if not selected_items:
             return
-        item = selected_items[0]
-        for identifier, list_item in self._items.items():
-            if list_item is item:
-                self.datasetSelected.emit(identifier)
-                break
+        identifier = selected_items[0].data(Qt.UserRole)
+        if identifier is not None:
+            self.datasetSelected.emit(int(identifier))
 
 
 class _FileItemWidget(QFrame):
@@ -162,15 +228,17 @@ class _FileItemWidget(QFrame):
             self.style_combo.blockSignals(True)
             self.style_combo.setCurrentIndex(index)
             self.style_combo.blockSignals(False)
+        messages = []
         if dataset.error:
-            self.status_label.setText(dataset.error)
-            self.status_label.setProperty("alert", True)
-        else:
-            message = ""
-            if not dataset.reference_hit:
-                message = "Reference torque not reached"
-            self.status_label.setText(message)
-            self.status_label.setProperty("alert", bool(message))
+            messages.append(dataset.error)
+        elif not dataset.reference_hit:
+            messages.append("Reference torque not reached")
+        alert = bool(messages)
+        if dataset.verdict is not None:
+            messages.append(dataset.verdict.summary())
+            alert = alert or not dataset.verdict.passed
+        self.status_label.setText(" · ".join(messages))
+        self.status_label.setProperty("alert", alert)
         self.status_label.style().unpolish(self.status_label)
         self.status_label.style().polish(self.status_label)
 
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+Signature = Tuple[int, int]
+
+
+class FolderWatcher(QObject):
+    """Reports CSV files that appear or change in a watched directory.
+
+    Change notifications come from ``QFileSystemWatcher`` (no polling). Bursts
+    of notifications, e.g. while a controller is still writing a file, are
+    debounced and then resolved against the last directory snapshot so only
+    new or modified files are emitted.
+    """
+
+    filesChanged = Signal(list)
+
+    DEBOUNCE_MS = 500
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule_scan)
+        self._directory: Optional[Path] = None
+        self._snapshot: Dict[Path, Signature] = {}
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._scan)
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return self._directory
+
+    def is_active(self) -> bool:
+        return self._directory is not None
+
+    def start(self, directory: Path) -> bool:
+        self.stop()
+        directory = Path(directory)
+        if not directory.is_dir() or not self._watcher.addPath(str(directory)):
+            return False
+        self._directory = directory
+        # Files already present are not ingested; only later arrivals are.
+        self._snapshot = self._list_files()
+        return True
+
+    def stop(self) -> None:
+        self._debounce.stop()
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._directory = None
+        self._snapshot = {}
+
+    def _schedule_scan(self, _path: str) -> None:
+        self._debounce.start()
+
+    def _scan(self) -> None:
+        if self._directory is None:
+            return
+        current = self._list_files()
+        changed: List[Path] = [
+            path for path, signature in current.items() if self._snapshot.get(path) != signature
+        ]
+        self._snapshot = current
+        if changed:
+            changed.sort(key=lambda path: current[path][1])
+            self.filesChanged.emit(changed)
+
+    def _list_files(self) -> Dict[Path, Signature]:
+        files: Dict[Path, Signature] = {}
+        if self._directory is None:
+            return files
+        try:
+            entries = list(self._directory.iterdir())
+        except OSError:
+            return files
+        for entry in entries:
+            if entry.suffix.lower() != ".csv":
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files[entry] = (stat.st_size, stat.st_mtime_ns)
+        return files
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import List, Sequence
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from data.data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+
+class LoadSignals(QObject):
+    fileLoaded = Signal(int, object)
+    fileFailed = Signal(int, str)
+    finished = Signal(bool)
+
+
+class LoadWorker(QRunnable):
+    """Parses CSV files off the GUI thread and reports each file as it completes."""
+
+    def __init__(self, manager: DataManager, paths: Sequence[Path]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = LoadSignals()
+        self._manager = manager
+        self._paths: List[Path] = [Path(p) for p in paths]
+        self._cancel = threading.Event()
+
+    @property
+    def total(self) -> int:
+        return len(self._paths)
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self) -> None:
+        results = self._manager.parse(self._paths)
+        try:
+            for index, (path, csv, warning) in enumerate(results):
+                if self._cancel.is_set():
+                    break
+                if csv is None:
+                    self.signals.fileFailed.emit(index, warning or path.name)
+                else:
+                    self.signals.fileLoaded.emit(index, csv)
+        except Exception as exc:  # pragma: no cover - defensive, keeps the UI alive
+            logger.exception("Background load failed")
+            self.signals.fileFailed.emit(-1, str(exc))
+        finally:
+            results.close()
+            self.signals.finished.emit(self._cancel.is_set())
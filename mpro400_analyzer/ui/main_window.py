@@ -1,10 +1,10 @@
 ﻿from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import Qt, QSize, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QCloseEvent, QIcon
 from PySide6.QtWidgets import (
     QFileDialog,
     QMainWindow,
@@ -18,10 +18,13 @@ from PySide6.QtWidgets import (
 )
 
 from app.config import AppConfig
-from data.data_manager import DataManager
+from data.csv_loader import CsvData
+from data.data_manager import CHANGE_STYLE, DataManager
 from export.export_image import export_image_dialog
 from ui.file_loader_widget import FileLoaderWidget
+from ui.folder_watcher import FolderWatcher
 from ui.guide_dialog import GuideDialog
+from ui.load_worker import LoadWorker
 from ui.plot_viewer_widget import PlotViewerWidget
 from ui.range_controls_widget import RangeControlsWidget
 
@@ -36,6 +39,21 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon("app.ICO"))
         self.resize(1200, 800)
 
+        self._load_worker: Optional[LoadWorker] = None
+        self._load_warnings: List[str] = []
+        self._load_done = 0
+        self._load_rejected = 0
+        self._load_ingest = False
+        self._pending_ingest: List[Path] = []
+
+        self.folder_watcher = FolderWatcher(self)
+
+        # Coalesces redraws requested by several files finishing back to back.
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._redraw_plot)
+
         self._build_ui()
         self._connect_signals()
 
@@ -50,8 +68,29 @@ class MainWindow(QMainWindow):
         self.action_append = QAction("추가 로드", self)
         self.action_clear = QAction("파일 초기화", self)
         self.action_export = QAction("이미지 내보내기", self)
-
-        for action in (self.action_open, self.action_append, self.action_clear, self.action_export):
+        self.action_cancel_load = QAction("불러오기 취소", self)
+        self.action_cancel_load.setEnabled(False)
+        self.action_watch = QAction("폴더 감시", self)
+        self.action_watch.setCheckable(True)
+        self.action_envelope = QAction("분포 보기", self)
+        self.action_envelope.setCheckable(True)
+        self.action_envelope.setToolTip("곡선 대신 P5–P95 범위와 중앙값 표시")
+        self.action_outliers = QAction("이상 곡선", self)
+        self.action_outliers.setCheckable(True)
+        self.action_outliers.setChecked(True)
+        self.action_outliers.setEnabled(False)
+        self.action_outliers.setToolTip("분포 보기에서 평균과 크게 다른 곡선 표시")
+
+        for action in (
+            self.action_open,
+            self.action_append,
+            self.action_clear,
+            self.action_export,
+            self.action_cancel_load,
+            self.action_watch,
+            self.action_envelope,
+            self.action_outliers,
+        ):
             self.toolbar.addAction(action)
 
         central = QWidget()
@@ -74,6 +113,7 @@ class MainWindow(QMainWindow):
 
         self.plot_viewer = PlotViewerWidget()
         self.plot_viewer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.plot_viewer.set_legend_outside(self.config.legend_outside)
 
         content_layout.addWidget(self.file_loader, stretch=0)
         content_layout.addWidget(self.plot_viewer, stretch=1)
@@ -89,6 +129,11 @@ class MainWindow(QMainWindow):
         self.action_append.triggered.connect(lambda: self._open_files(replace=False))
         self.action_clear.triggered.connect(self._clear_all_files)
         self.action_export.triggered.connect(self._export_plot)
+        self.action_cancel_load.triggered.connect(self._cancel_load)
+        self.action_watch.toggled.connect(self._toggle_folder_watch)
+        self.folder_watcher.filesChanged.connect(self._on_watched_files)
+        self.action_envelope.toggled.connect(self._on_plot_mode_changed)
+        self.action_outliers.toggled.connect(self._on_plot_mode_changed)
 
         self.file_loader.datasetToggled.connect(self._on_dataset_toggled)
         self.file_loader.datasetSelected.connect(self._on_dataset_selected)
@@ -112,14 +157,144 @@ class MainWindow(QMainWindow):
         if not paths:
             return
 
-        warnings = self.manager.load([Path(p) for p in paths], append=not replace)
         self.config.last_dir = str(Path(paths[-1]).parent)
-        self._after_data_mutation(warnings)
+        if replace:
+            self.manager.clear()
+            self._refresh_after_change()
+        self._start_load([Path(p) for p in paths])
+
+    # ------------------------------------------------------------------
+    # Background loading
+    # ------------------------------------------------------------------
+    def _start_load(self, paths: Sequence[Path], ingest: bool = False) -> None:
+        if self._load_worker is not None:
+            return
+        self._load_warnings = []
+        self._load_done = 0
+        self._load_rejected = 0
+        self._load_ingest = ingest
+
+        worker = LoadWorker(self.manager, paths)
+        worker.signals.fileLoaded.connect(self._on_file_loaded)
+        worker.signals.fileFailed.connect(self._on_file_failed)
+        worker.signals.finished.connect(self._on_load_finished)
+        self._load_worker = worker
+
+        self.action_open.setEnabled(False)
+        self.action_append.setEnabled(False)
+        self.action_cancel_load.setEnabled(True)
+        self._show_load_progress()
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_load(self) -> None:
+        if self._load_worker is None:
+            return
+        self._load_worker.cancel()
+        self.statusBar().showMessage("불러오기를 취소하는 중...")
 
-    def _after_data_mutation(self, warnings: Sequence[str]) -> None:
-        self._refresh_file_list()
+    def _on_file_loaded(self, _index: int, csv: CsvData) -> None:
+        if self._load_worker is None or self._load_worker.is_cancelled():
+            return
+        self._load_done += 1
+        if self._load_ingest:
+            self._ingest_loaded(csv)
+            self._show_load_progress()
+            return
+        dataset = self.manager.add_csv(csv)
+        if dataset is None:
+            # The manager is full; stop parsing the rest of the batch.
+            self._load_rejected += 1
+            self._load_worker.cancel()
+        else:
+            self.file_loader.add_dataset(dataset)
+            self._redraw_timer.start()
+        self._show_load_progress()
+
+    def _ingest_loaded(self, csv: CsvData) -> None:
+        dataset, removed = self.manager.ingest(csv)
+        for identifier in removed:
+            self.file_loader.remove_dataset(identifier)
+        if dataset is not None:
+            self.file_loader.add_dataset(dataset)
+            self._redraw_timer.start()
+
+    def _on_file_failed(self, _index: int, message: str) -> None:
+        if self._load_worker is None or self._load_worker.is_cancelled():
+            return
+        self._load_done += 1
+        self._load_warnings.append(message)
+        self._show_load_progress()
+
+    def _on_load_finished(self, cancelled: bool) -> None:
+        self._load_worker = None
+        self.action_open.setEnabled(True)
+        self.action_append.setEnabled(True)
+        self.action_cancel_load.setEnabled(False)
+
+        warnings = list(self._load_warnings)
+        if self._load_rejected:
+            warnings.append(self.manager.limit_message())
+        self._redraw_timer.stop()
         self._redraw_plot()
-        self._show_warnings(warnings)
+        count = len(self.manager.datasets())
+        if cancelled and not self._load_rejected:
+            self.statusBar().showMessage(f"불러오기 취소됨 · 불러온 파일: {count}")
+        elif self._load_ingest:
+            # Watched folders update continuously; a modal dialog per failed
+            # file would block the operator.
+            message = f"폴더 감시 중 · 불러온 파일: {count}"
+            if warnings:
+                message += f" · 경고: {warnings[-1]}"
+            self.statusBar().showMessage(message)
+        else:
+            self.statusBar().showMessage(f"불러온 파일: {count}")
+            self._show_warnings(warnings)
+
+        if self._pending_ingest and self.folder_watcher.is_active():
+            pending, self._pending_ingest = self._pending_ingest, []
+            self._start_load(pending, ingest=True)
+
+    # ------------------------------------------------------------------
+    # Watched folder
+    # ------------------------------------------------------------------
+    def _toggle_folder_watch(self, enabled: bool) -> None:
+        if not enabled:
+            self.folder_watcher.stop()
+            self._pending_ingest = []
+            self.statusBar().showMessage("폴더 감시를 중지했습니다.")
+            return
+
+        start_dir = Path(self.config.last_dir) if self.config.last_dir else Path.home()
+        directory = QFileDialog.getExistingDirectory(self, "감시할 폴더 선택", str(start_dir))
+        if not directory or not self.folder_watcher.start(Path(directory)):
+            self.action_watch.blockSignals(True)
+            self.action_watch.setChecked(False)
+            self.action_watch.blockSignals(False)
+            return
+
+        self.config.last_dir = directory
+        self.manager.rolling_limit = self.config.watch_window
+        self.statusBar().showMessage(f"폴더 감시 중: {directory}")
+
+    def _on_watched_files(self, paths: List[Path]) -> None:
+        if self._load_worker is not None:
+            self._pending_ingest.extend(p for p in paths if p not in self._pending_ingest)
+            return
+        self._start_load(paths, ingest=True)
+
+    def _show_load_progress(self) -> None:
+        if self._load_worker is None:
+            return
+        self.statusBar().showMessage(
+            f"불러오는 중... {self._load_done}/{self._load_worker.total}"
+        )
+
+    def closeEvent(self, event: QCloseEvent) -> None:  # type: ignore[override]
+        self.folder_watcher.stop()
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
 
     def _refresh_file_list(self) -> None:
         datasets = self.manager.datasets()
@@ -127,8 +302,67 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"불러온 파일: {len(datasets)}")
 
     def _redraw_plot(self) -> None:
-        payloads = self.manager.plot_payloads()
-        self.plot_viewer.update_plot(payloads)
+        """Bring the plot up to date with the manager's pending changes.
+
+        Style and visibility edits touch only the affected line; anything
+        that changes every payload (files added/removed, reference torque,
+        ranges) rebuilds the figure.
+        """
+
+        changes = self.manager.take_changes()
+        if changes:
+            # Cached per dataset; only new or changed curves are evaluated.
+            self.manager.evaluate_specs()
+        if changes.full:
+            self._draw_all()
+            for dataset in self.manager.datasets():
+                self.file_loader.update_dataset(dataset)
+            return
+
+        if self.action_envelope.isChecked():
+            # The envelope depends on every curve; redraw it as a whole.
+            if changes:
+                self._draw_all()
+            for identifier in changes.datasets:
+                dataset = self.manager.dataset(identifier)
+                if dataset is not None:
+                    self.file_loader.update_dataset(dataset)
+            return
+
+        for identifier, kind in changes.datasets.items():
+            dataset = self.manager.dataset(identifier)
+            if dataset is None:
+                continue
+            if kind == CHANGE_STYLE:
+                self.plot_viewer.restyle_series(identifier, dataset.color, dataset.line_style)
+            else:
+                payload = self.manager.payload_for(identifier)
+                if payload is None:
+                    self.plot_viewer.hide_series(identifier)
+                else:
+                    self.plot_viewer.update_series(payload)
+            self.file_loader.update_dataset(dataset)
+
+    def _draw_all(self) -> None:
+        if not self.action_envelope.isChecked():
+            self.plot_viewer.update_plot(self.manager.plot_payloads())
+            return
+
+        envelope = self.manager.envelope()
+        if envelope is None:
+            self.plot_viewer.update_plot([])
+            return
+        outliers = []
+        if self.action_outliers.isChecked():
+            for identifier in envelope.outliers:
+                payload = self.manager.payload_for(identifier)
+                if payload is not None:
+                    outliers.append(payload)
+        self.plot_viewer.update_envelope(envelope, outliers)
+
+    def _on_plot_mode_changed(self, _checked: bool) -> None:
+        self.action_outliers.setEnabled(self.action_envelope.isChecked())
+        self._draw_all()
         for dataset in self.manager.datasets():
             self.file_loader.update_dataset(dataset)
 
@@ -142,6 +376,7 @@ class MainWindow(QMainWindow):
         self._redraw_plot()
 
     def _clear_all_files(self) -> None:
+        self._cancel_load()
         if not self.manager.datasets():
             return
         self.manager.clear()
@@ -165,7 +400,8 @@ class MainWindow(QMainWindow):
 
     def _on_reference_changed(self, value: float) -> None:
         self.manager.update_reference(value)
-        self._redraw_plot()
+        # Coalesce spin box bursts into one redraw per event loop pass.
+        self._redraw_timer.start()
 
     def _on_filters_changed(
         self,
@@ -173,7 +409,7 @@ class MainWindow(QMainWindow):
         angle: Tuple[Optional[float], Optional[float]],
     ) -> None:
         self.manager.update_ranges(torque, angle)
-        self._redraw_plot()
+        self._redraw_timer.start()
 
     def _export_plot(self) -> None:
         export_image_dialog(self, self.plot_viewer)
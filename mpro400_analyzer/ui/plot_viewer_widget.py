@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 
 from data.data_manager import PlotPayload
+from data.envelope import Envelope
 from plots.plotter import HoverDetails, Plotter
 
 
@@ -122,6 +123,21 @@ class PlotViewerWidget(QWidget):
     def update_plot(self, payloads: Iterable[PlotPayload]) -> None:
         self.plotter.draw(payloads)
 
+    def update_envelope(self, envelope: Envelope, outliers: Iterable[PlotPayload] = ()) -> None:
+        self.plotter.draw_envelope(envelope, outliers)
+
+    def update_series(self, payload: PlotPayload) -> None:
+        self.plotter.update_series(payload)
+
+    def hide_series(self, identifier: int) -> None:
+        self.plotter.hide_series(identifier)
+
+    def restyle_series(self, identifier: int, color: str, line_style: str) -> None:
+        self.plotter.restyle_series(identifier, color, line_style)
+
+    def set_legend_outside(self, outside: bool) -> None:
+        self.plotter.set_legend_outside(outside)
+
     def save_image(self, path: str, dpi: int) -> None:
         self.plotter.save(path, dpi)
 